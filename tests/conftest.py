@@ -23,7 +23,9 @@ import base64
 from pathlib import Path
 import allure
 
-from tests.helpers.k8s import get_platform_namespaces
+from tests.helpers.k8s import get_platform_namespaces, list_platform_ingresses, close_http_session
+from tests.helpers.port_forward import PortForward
+from tests.helpers.vault import close_shared_vault_clients
 
 
 logger = logging.getLogger(__name__)
@@ -105,6 +107,26 @@ def platform_namespaces(core_v1, namespace_filter):
     return get_platform_namespaces(core_v1, namespace_filter)
 
 
+@pytest.fixture(scope="module")
+def platform_ingresses(networking_v1, platform_namespaces):
+    """Ingresses in the platform namespaces, listed once per test module.
+    
+    Shared by the read-only ingress checks so the cluster is listed with a
+    single all-namespaces call instead of once per namespace per test.
+    
+    Scope: module (tests that deploy new ingresses should list them
+    themselves with list_platform_ingresses() after deploying)
+    
+    Dependencies:
+        - networking_v1: Kubernetes NetworkingV1Api client
+        - platform_namespaces: Namespaces to include
+    
+    Returns:
+        list: V1Ingress objects
+    """
+    return list_platform_ingresses(networking_v1, platform_namespaces)
+
+
 # =============================================================================
 # PYTEST HOOKS - Screenshot capture on test completion
 # =============================================================================
@@ -193,6 +215,12 @@ def pytest_addoption(parser):
         default=None,
         help="Update baselines. Use 'all' to update all, 'prometheus' for metrics, or 'test_name' for specific visual tests"
     )
+    parser.addoption(
+        "--no-metric-cache",
+        action="store_true",
+        default=False,
+        help="Always query Prometheus instead of reusing metric names cached on disk"
+    )
 
 
 def pytest_configure(config):
@@ -346,6 +374,13 @@ class ColoredTerminalReporter:
                 self.failed.append((item.nodeid, report.longreprtext))
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Release pooled HTTP connections, Vault clients and port-forwards."""
+    close_http_session()
+    close_shared_vault_clients()
+    PortForward.close_all()
+
+
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
     """Custom terminal summary with colors."""
     reporter = ColoredTerminalReporter()
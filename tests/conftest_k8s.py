@@ -6,15 +6,27 @@ This module provides session-scoped Kubernetes API clients and logging configura
 Fixtures:
     - configure_safe_logging: Auto-configures logging to handle surrogate characters
     - k8s_config: Loads Kubernetes configuration once per session
+    - api_client: Shared ApiClient with an enlarged connection pool
     - core_v1: Kubernetes CoreV1Api client (pods, namespaces, secrets, configmaps)
     - apps_v1: Kubernetes AppsV1Api client (deployments, statefulsets, daemonsets)
     - batch_v1: Kubernetes BatchV1Api client (jobs, cronjobs)
     - networking_v1: Kubernetes NetworkingV1Api client (ingresses, network policies)
     - custom_api: Kubernetes CustomObjectsApi client (ArgoCD CRDs, certificates)
+    - backup_cronjobs: Backup CronJobs, listed once per session
+    - backup_jobs_by_cronjob: Backup Jobs grouped by CronJob, listed once per session
 """
 import pytest
 import logging
+from collections import defaultdict
 from kubernetes import client, config
+from kubernetes.client.rest import ApiException
+
+
+# urllib3 pool size for the shared ApiClient. The default (4) serializes
+# concurrent LIST calls on connection acquisition.
+CONNECTION_POOL_MAXSIZE = 32
+
+BACKUP_NAMESPACE = "glueops-core-backup"  # namespace of the backup CronJobs
 
 
 class SafeUnicodeFilter(logging.Filter):
@@ -90,7 +102,27 @@ def k8s_config():
 
 
 @pytest.fixture(scope="session")
-def core_v1(k8s_config):
+def api_client(k8s_config):
+    """Shared Kubernetes ApiClient for all API group clients.
+    
+    Copies the loaded kubeconfig configuration and raises the urllib3
+    connection pool size so concurrent requests from the same session
+    reuse keep-alive connections instead of queueing for one.
+    
+    Scope: session (one connection pool shared across all tests)
+    
+    Dependencies:
+        - k8s_config: Ensures kubeconfig is loaded
+    """
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    api = client.ApiClient(configuration)
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="session")
+def core_v1(api_client):
     """Kubernetes CoreV1Api client.
     
     Provides access to core Kubernetes resources:
@@ -103,13 +135,13 @@ def core_v1(k8s_config):
     Scope: session (client reused across all tests)
     
     Dependencies:
-        - k8s_config: Ensures kubeconfig is loaded
+        - api_client: Shared ApiClient (connection pool)
     """
-    return client.CoreV1Api()
+    return client.CoreV1Api(api_client)
 
 
 @pytest.fixture(scope="session")
-def apps_v1(k8s_config):
+def apps_v1(api_client):
     """Kubernetes AppsV1Api client.
     
     Provides access to workload resources:
@@ -121,13 +153,13 @@ def apps_v1(k8s_config):
     Scope: session (client reused across all tests)
     
     Dependencies:
-        - k8s_config: Ensures kubeconfig is loaded
+        - api_client: Shared ApiClient (connection pool)
     """
-    return client.AppsV1Api()
+    return client.AppsV1Api(api_client)
 
 
 @pytest.fixture(scope="session")
-def batch_v1(k8s_config):
+def batch_v1(api_client):
     """Kubernetes BatchV1Api client.
     
     Provides access to batch resources:
@@ -137,13 +169,13 @@ def batch_v1(k8s_config):
     Scope: session (client reused across all tests)
     
     Dependencies:
-        - k8s_config: Ensures kubeconfig is loaded
+        - api_client: Shared ApiClient (connection pool)
     """
-    return client.BatchV1Api()
+    return client.BatchV1Api(api_client)
 
 
 @pytest.fixture(scope="session")
-def networking_v1(k8s_config):
+def networking_v1(api_client):
     """Kubernetes NetworkingV1Api client.
     
     Provides access to networking resources:
@@ -154,13 +186,13 @@ def networking_v1(k8s_config):
     Scope: session (client reused across all tests)
     
     Dependencies:
-        - k8s_config: Ensures kubeconfig is loaded
+        - api_client: Shared ApiClient (connection pool)
     """
-    return client.NetworkingV1Api()
+    return client.NetworkingV1Api(api_client)
 
 
 @pytest.fixture(scope="session")
-def custom_api(k8s_config):
+def custom_api(api_client):
     """Kubernetes CustomObjectsApi client.
     
     Provides access to custom resources (CRDs):
@@ -171,6 +203,55 @@ def custom_api(k8s_config):
     Scope: session (client reused across all tests)
     
     Dependencies:
-        - k8s_config: Ensures kubeconfig is loaded
+        - api_client: Shared ApiClient (connection pool)
+    """
+    return client.CustomObjectsApi(api_client)
+
+
+@pytest.fixture(scope="session")
+def backup_cronjobs(batch_v1):
+    """Backup CronJobs in the glueops-core-backup namespace.
+    
+    Listed once and shared by the backup status and trigger tests.
+    
+    Scope: session (one LIST call per run)
+    
+    Dependencies:
+        - batch_v1: Kubernetes BatchV1Api client
+    
+    Returns:
+        list: V1CronJob objects
+    
+    Raises:
+        pytest.fail: If the namespace is missing or the API call fails
+    """
+    try:
+        return batch_v1.list_namespaced_cron_job(namespace=BACKUP_NAMESPACE).items
+    except ApiException as e:
+        if e.status == 404:
+            pytest.fail(f"Namespace {BACKUP_NAMESPACE} not found")
+        else:
+            pytest.fail(f"API error: {e.reason}")
+
+
+@pytest.fixture(scope="session")
+def backup_jobs_by_cronjob(batch_v1):
+    """Backup Jobs grouped by the value of their 'cronjob' label.
+    
+    Fetches every Job in the backup namespace with a single LIST and
+    groups them locally, instead of one labelled LIST per CronJob.
+    
+    Scope: session (snapshot taken on first use)
+    
+    Dependencies:
+        - batch_v1: Kubernetes BatchV1Api client
+    
+    Returns:
+        dict: CronJob name -> list of V1Job objects (missing names have no jobs)
     """
-    return client.CustomObjectsApi()
+    jobs_by_cronjob = defaultdict(list)
+    for job in batch_v1.list_namespaced_job(namespace=BACKUP_NAMESPACE).items:
+        cronjob_name = (job.metadata.labels or {}).get('cronjob')
+        if cronjob_name:
+            jobs_by_cronjob[cronjob_name].append(job)
+    return dict(jobs_by_cronjob)
@@ -7,7 +7,8 @@ via port-forwarding, including Vault, Prometheus, and Alertmanager.
 Fixtures:
     - prometheus_url: Port-forward to Prometheus and yield local URL
     - alertmanager_url: Port-forward to Alertmanager and yield local URL
-    - vault_client: Vault client with automatic port-forward and cleanup
+    - vault_session_client: Session-wide authenticated Vault client
+    - vault_client: Per-test handle on the session Vault client
     - cleanup_vault_secrets_session: Session-scoped cleanup of orphaned secrets
     - vault_test_secrets: Vault secret manager with pre/post cleanup
 """
@@ -26,15 +27,15 @@ logger = logging.getLogger(__name__)
 # PORT-FORWARD FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prometheus_url():
     """
     Port-forward to Prometheus and yield local URL.
     
-    Automatically establishes kubectl port-forward to Prometheus service
-    and cleans up the connection after the test completes.
+    Establishes the port-forward to the Prometheus service once; every
+    test in the session shares it until session teardown.
     
-    Scope: function (new connection per test)
+    Scope: session
     
     Service Details:
         - Namespace: glueops-core-kube-prometheus-stack
@@ -49,7 +50,7 @@ def prometheus_url():
             response = requests.get(f"{prometheus_url}/api/v1/query?query=up")
             assert response.status_code == 200
     """
-    with PortForward("glueops-core-kube-prometheus-stack", "kps-prometheus", 9090) as pf:
+    with PortForward("glueops-core-kube-prometheus-stack", "kps-prometheus", 9090, reuse=True) as pf:
         yield f"http://127.0.0.1:{pf.local_port}"
 
 
@@ -58,10 +59,10 @@ def alertmanager_url():
     """
     Port-forward to Alertmanager and yield local URL.
     
-    Automatically establishes kubectl port-forward to Alertmanager service
+    Automatically establishes a port-forward to Alertmanager service
     and cleans up the connection after the test completes.
     
-    Scope: function (new connection per test)
+    Scope: function
     
     Service Details:
         - Namespace: glueops-core-kube-prometheus-stack
@@ -81,34 +82,49 @@ def alertmanager_url():
 
 
 # =============================================================================
-# VAULT CLIENT FIXTURE
+# VAULT CLIENT FIXTURES
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def vault_session_client(captain_domain):
+    """
+    Authenticated Vault client shared by every Vault fixture in the session.
+    
+    The root token is read, the port-forward started and the client
+    authenticated once; later fixtures reuse the same client and its
+    keep-alive connections. Released by close_shared_vault_clients()
+    in pytest_sessionfinish.
+    
+    Scope: session
+    
+    Returns:
+        hvac.Client: Authenticated Vault client
+    """
+    from tests.helpers.vault import get_shared_vault_client
+    
+    return get_shared_vault_client(captain_domain, vault_namespace="glueops-core-vault")
+
+
 @pytest.fixture
-def vault_client(captain_domain, request):
+def vault_client(vault_session_client):
     """
-    Vault client with automatic port-forward and cleanup.
+    Authenticated Vault client for a single test.
     
-    Establishes kubectl port-forward to Vault, authenticates, and yields
-    an authenticated hvac.Client. Automatically cleans up port-forward
-    on test completion.
+    Yields the session-wide client from vault_session_client, so tests
+    don't pay for a fresh token lookup, port-forward and authentication.
     
-    Scope: function (new connection per test)
+    Scope: function (client is shared across the session)
     
     Service Details:
         - Namespace: glueops-core-vault
         - Vault authentication via Kubernetes service account or token
     
     Dependencies:
-        - captain_domain: Captain domain fixture for Vault configuration
+        - vault_session_client: Session-wide Vault client
     
     Returns:
         hvac.Client: Authenticated Vault client
     
-    Raises:
-        ImportError: If hvac library not installed
-        pytest.skip: If required environment variables not set
-    
     Usage:
         def test_vault_secrets(vault_client):
             # Create secret
@@ -121,18 +137,7 @@ def vault_client(captain_domain, request):
             result = vault_client.secrets.kv.v2.read_secret_version(path="test/path")
             assert result['data']['data']['key'] == 'value'
     """
-    from tests.helpers.vault import get_vault_client, cleanup_vault_client
-    
-    vault_namespace = "glueops-core-vault"
-    
-    client = get_vault_client(
-        captain_domain, 
-        vault_namespace=vault_namespace
-    )
-    
-    yield client
-    
-    cleanup_vault_client(client)
+    yield vault_session_client
 
 
 # =============================================================================
@@ -193,7 +198,7 @@ class VaultSecretManager:
 
 
 @pytest.fixture(scope="session")
-def cleanup_vault_secrets_session(captain_domain):
+def cleanup_vault_secrets_session(vault_session_client):
     """
     Session-scoped cleanup of orphaned Vault secrets from previous runs.
     
@@ -206,35 +211,25 @@ def cleanup_vault_secrets_session(captain_domain):
     Raises:
         RuntimeError: If cleanup fails (blocks test session)
     """
-    from tests.helpers.vault import (
-        get_vault_client,
-        cleanup_vault_client,
-        cleanup_all_vault_secrets,
-        ensure_placeholder_secret
-    )
+    from tests.helpers.vault import cleanup_all_vault_secrets, ensure_placeholder_secret
     
     logger.info("\n" + "="*70)
     logger.info("SESSION STARTUP: Cleaning orphaned Vault secrets")
     logger.info("="*70)
     
-    client = get_vault_client(captain_domain, vault_namespace="glueops-core-vault")
+    # Clean up all secrets except placeholder
+    cleanup_all_vault_secrets(vault_session_client, mount_point='secret')
     
-    try:
-        # Clean up all secrets except placeholder
-        cleanup_all_vault_secrets(client, mount_point='secret')
-        
-        # Ensure placeholder secret exists with updated timestamp
-        ensure_placeholder_secret(client, mount_point='secret')
-        
-        logger.info("✓ Session Vault cleanup complete\n")
-    finally:
-        cleanup_vault_client(client)
+    # Ensure placeholder secret exists with updated timestamp
+    ensure_placeholder_secret(vault_session_client, mount_point='secret')
+    
+    logger.info("✓ Session Vault cleanup complete\n")
     
     yield
 
 
 @pytest.fixture
-def vault_test_secrets(captain_domain, cleanup_vault_secrets_session):
+def vault_test_secrets(vault_session_client, cleanup_vault_secrets_session):
     """
     Vault secret manager with pre-cleanup and post-cleanup.
     
@@ -248,7 +243,7 @@ def vault_test_secrets(captain_domain, cleanup_vault_secrets_session):
     orphaned secrets from previous runs.
     
     Dependencies:
-        - captain_domain: Captain domain fixture for Vault configuration
+        - vault_session_client: Session-wide Vault client
         - cleanup_vault_secrets_session: Session cleanup (runs first)
     
     Returns:
@@ -271,44 +266,35 @@ def vault_test_secrets(captain_domain, cleanup_vault_secrets_session):
             # Access the underlying client if needed
             client = vault_test_secrets.client
     """
-    from tests.helpers.vault import (
-        get_vault_client,
-        cleanup_vault_client,
-        cleanup_all_vault_secrets,
-        ensure_placeholder_secret
-    )
+    from tests.helpers.vault import cleanup_all_vault_secrets, ensure_placeholder_secret
+    
+    client = vault_session_client
     
     logger.info("\n" + "="*70)
     logger.info("VAULT TEST SETUP: Pre-cleanup")
     logger.info("="*70)
     
-    client = get_vault_client(captain_domain, vault_namespace="glueops-core-vault")
+    # Pre-cleanup: Delete all secrets except placeholder
+    cleanup_all_vault_secrets(client, mount_point='secret')
     
-    try:
-        # Pre-cleanup: Delete all secrets except placeholder
-        cleanup_all_vault_secrets(client, mount_point='secret')
-        
-        # Ensure placeholder secret exists with updated timestamp
-        ensure_placeholder_secret(client, mount_point='secret')
-        
-        logger.info("✓ Pre-cleanup complete\n")
-        
-        # Create manager and yield to test
-        manager = VaultSecretManager(client=client, mount_point='secret')
-        
-        yield manager
-        
-        # Post-cleanup: Delete all secrets except placeholder
-        logger.info("\n" + "="*70)
-        logger.info("VAULT TEST TEARDOWN: Post-cleanup")
-        logger.info("="*70)
-        
-        cleanup_all_vault_secrets(client, mount_point='secret')
-        
-        # Update placeholder timestamp after cleanup
-        ensure_placeholder_secret(client, mount_point='secret')
-        
-        logger.info("✓ Post-cleanup complete\n")
-        
-    finally:
-        cleanup_vault_client(client)
+    # Ensure placeholder secret exists with updated timestamp
+    ensure_placeholder_secret(client, mount_point='secret')
+    
+    logger.info("✓ Pre-cleanup complete\n")
+    
+    # Create manager and yield to test
+    manager = VaultSecretManager(client=client, mount_point='secret')
+    
+    yield manager
+    
+    # Post-cleanup: Delete all secrets except placeholder
+    logger.info("\n" + "="*70)
+    logger.info("VAULT TEST TEARDOWN: Post-cleanup")
+    logger.info("="*70)
+    
+    cleanup_all_vault_secrets(client, mount_point='secret')
+    
+    # Update placeholder timestamp after cleanup
+    ensure_placeholder_secret(client, mount_point='secret')
+    
+    logger.info("✓ Post-cleanup complete\n")
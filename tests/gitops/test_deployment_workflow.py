@@ -13,7 +13,7 @@ from tests.helpers.assertions import (
     assert_ingress_valid,
     assert_ingress_dns_valid
 )
-from tests.helpers.k8s import validate_http_debug_app
+from tests.helpers.k8s import validate_http_debug_apps, list_platform_ingresses
 from tests.helpers.github import create_github_file
 from tests.helpers.argocd import wait_for_appset_apps_created_and_healthy, calculate_expected_app_count
 from tests.helpers.utils import print_section_header, print_summary_list
@@ -134,7 +134,8 @@ def test_create_custom_deployment_repo(ingress_class_name, captain_manifests, ep
     # Validate Ingress configuration
     print_section_header("STEP 4: Validating Ingress Configuration")
     
-    total_ingresses = assert_ingress_valid(networking_v1, platform_namespaces)
+    ingresses = list_platform_ingresses(networking_v1, platform_namespaces)
+    total_ingresses = assert_ingress_valid(networking_v1, platform_namespaces, ingresses)
     
     # Validate DNS resolution for Ingress hosts
     print_section_header("STEP 5: Validating Ingress DNS Resolution")
@@ -143,6 +144,7 @@ def test_create_custom_deployment_repo(ingress_class_name, captain_manifests, ep
         networking_v1,
         platform_namespaces,
         dns_server='1.1.1.1',
+        ingresses=ingresses,
     )
     
     # Validate JSON responses from each deployed application
@@ -151,28 +153,12 @@ def test_create_custom_deployment_repo(ingress_class_name, captain_manifests, ep
     import time
     time.sleep(120)  # Wait for external-dns to sync new ingresses
     
-    validation_errors = []
-    
-    for idx, app in enumerate(app_info, 1):
-        app_name = app['name']
-        hostname = app['hostname']
-        url = app['url']
-        
-        logger.info(f"[{idx}/{len(app_info)}] {app_name}")
-        
-        # Use helper function to validate http-debug app
-        problems, response_data = validate_http_debug_app(
-            url=url,
-            expected_hostname=hostname,
-            app_name=app_name,
-            max_retries=3,
-            retry_delays=[10, 30, 60],
-        )
-        
-        if problems:
-            validation_errors.extend(problems)
-        
-        logger.info("")
+    # Validate all apps concurrently; each one is independent network I/O
+    validation_errors, _ = validate_http_debug_apps(
+        [(app['url'], app['hostname'], app['name']) for app in app_info],
+        max_retries=3,
+        retry_delays=[10, 30, 60],
+    )
     
     # Assert no validation errors occurred
     print_section_header("FINAL SUMMARY")
@@ -15,7 +15,7 @@ from tests.helpers.assertions import (
     assert_ingress_valid,
     assert_ingress_dns_valid
 )
-from tests.helpers.k8s import validate_whoami_env_vars
+from tests.helpers.k8s import validate_whoami_env_vars_many, list_platform_ingresses
 from tests.helpers.github import create_github_file
 from tests.helpers.argocd import wait_for_appset_apps_created_and_healthy, calculate_expected_app_count
 from tests.helpers.utils import print_section_header, print_summary_list
@@ -162,7 +162,8 @@ def test_externalsecrets_vault_integration(ingress_class_name, vault_test_secret
     # Validate Ingress configuration
     print_section_header("STEP 5: Validating Ingress Configuration")
     
-    assert_ingress_valid(networking_v1, platform_namespaces)
+    ingresses = list_platform_ingresses(networking_v1, platform_namespaces)
+    assert_ingress_valid(networking_v1, platform_namespaces, ingresses)
     
     # Validate DNS resolution for Ingress hosts
     print_section_header("STEP 6: Validating Ingress DNS Resolution")
@@ -170,7 +171,8 @@ def test_externalsecrets_vault_integration(ingress_class_name, vault_test_secret
     assert_ingress_dns_valid(
         networking_v1,
         platform_namespaces,
-        dns_server='1.1.1.1'
+        dns_server='1.1.1.1',
+        ingresses=ingresses
     )
     print_section_header("STEP 6.1: Wait 2mins for external-dns sync")
     import time
@@ -179,12 +181,9 @@ def test_externalsecrets_vault_integration(ingress_class_name, vault_test_secret
     # Validate environment variables from Vault
     print_section_header("STEP 7: Validating Environment Variables from Vault")
     
-    validation_errors = []
+    validation_items = []
     
-    for idx, app in enumerate(app_info, 1):
-        app_name = app['name']
-        url = app['url']
-        
+    for app in app_info:
         # Combine all expected environment variables (spot check 3 from each)
         expected_env_vars = {}
         
@@ -196,17 +195,14 @@ def test_externalsecrets_vault_integration(ingress_class_name, vault_test_secret
         for key in extra_secret_keys:
             expected_env_vars[key] = app['extra_secrets'][key]
         
-        # Validate environment variables
-        problems, env_vars = validate_whoami_env_vars(
-            url=url,
-            expected_env_vars=expected_env_vars,
-            app_name=app_name,
-            max_retries=3,
-            retry_delays=[10, 30, 60]
-        )
-        
-        if problems:
-            validation_errors.extend(problems)
+        validation_items.append((app['url'], expected_env_vars, app['name']))
+    
+    # Validate environment variables for all apps concurrently
+    validation_errors, _ = validate_whoami_env_vars_many(
+        validation_items,
+        max_retries=3,
+        retry_delays=[10, 30, 60]
+    )
     
     # Assert no validation errors occurred
     if validation_errors:
@@ -17,15 +17,19 @@ Submodules:
 from tests.helpers.k8s import (
     get_platform_namespaces,
     wait_for_job_completion,
+    wait_for_jobs_completion,
     validate_pod_execution,
     validate_all_argocd_apps,
     validate_pod_health,
     validate_failed_jobs,
+    list_platform_ingresses,
     validate_ingress_configuration,
     validate_ingress_dns,
     validate_certificate_secret,
+    validate_certificate_secrets,
     validate_https_certificate,
     validate_http_debug_app,
+    validate_http_debug_apps,
     wait_for_certificate_ready,
     get_ingress_load_balancer_ip,
 )
@@ -50,15 +54,19 @@ __all__ = [
     # k8s validators
     'get_platform_namespaces',
     'wait_for_job_completion',
+    'wait_for_jobs_completion',
     'validate_pod_execution',
     'validate_all_argocd_apps',
     'validate_pod_health',
     'validate_failed_jobs',
+    'list_platform_ingresses',
     'validate_ingress_configuration',
     'validate_ingress_dns',
     'validate_certificate_secret',
+    'validate_certificate_secrets',
     'validate_https_certificate',
     'validate_http_debug_app',
+    'validate_http_debug_apps',
     'wait_for_certificate_ready',
     'get_ingress_load_balancer_ip',
     # assertions
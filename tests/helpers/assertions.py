@@ -13,7 +13,8 @@ from tests.helpers.k8s import (
     validate_pod_health,
     validate_ingress_configuration,
     validate_ingress_dns,
-    validate_certificate_secret,
+    validate_certificate_secrets,
+    log_certificate_info,
     validate_https_certificate,
     validate_http_debug_app,
     wait_for_certificate_ready,
@@ -87,13 +88,14 @@ def assert_pods_healthy(core_v1, platform_namespaces):
     logger.info(f"\n✓ All pods are healthy")
 
 
-def assert_ingress_valid(networking_v1, platform_namespaces):
+def assert_ingress_valid(networking_v1, platform_namespaces, ingresses=None):
     """
     Validate ingress configuration and fail test if invalid.
     
     Args:
         networking_v1: Kubernetes NetworkingV1Api client
         platform_namespaces: List of namespaces to check
+        ingresses: Optional prefetched list from list_platform_ingresses()
     
     Returns:
         int: Total number of ingresses checked
@@ -103,7 +105,7 @@ def assert_ingress_valid(networking_v1, platform_namespaces):
     """
     logger.info(f"\n🔍 Checking Ingress resources across platform...\n")
     
-    problems, total_ingresses = validate_ingress_configuration(networking_v1, platform_namespaces)
+    problems, total_ingresses = validate_ingress_configuration(networking_v1, platform_namespaces, ingresses)
     
     if problems:
         _log_validation_failure("INGRESS CONFIGURATION VALIDATION FAILED", problems)
@@ -114,7 +116,7 @@ def assert_ingress_valid(networking_v1, platform_namespaces):
     return total_ingresses
 
 
-def assert_ingress_dns_valid(networking_v1, platform_namespaces, dns_server='1.1.1.1'):
+def assert_ingress_dns_valid(networking_v1, platform_namespaces, dns_server='1.1.1.1', ingresses=None):
     """
     Validate ingress DNS resolution and fail test if invalid.
     
@@ -122,6 +124,7 @@ def assert_ingress_dns_valid(networking_v1, platform_namespaces, dns_server='1.1
         networking_v1: Kubernetes NetworkingV1Api client
         platform_namespaces: List of namespaces to check
         dns_server: DNS server to query (default: '1.1.1.1')
+        ingresses: Optional prefetched list from list_platform_ingresses()
     
     Returns:
         int: Number of hosts checked
@@ -131,7 +134,7 @@ def assert_ingress_dns_valid(networking_v1, platform_namespaces, dns_server='1.1
     """
     logger.info(f"\n🔍 Checking DNS resolution for all Ingress hosts...\n")
     
-    problems, checked_count = validate_ingress_dns(networking_v1, platform_namespaces, dns_server)
+    problems, checked_count = validate_ingress_dns(networking_v1, platform_namespaces, dns_server, ingresses)
     
     if problems:
         _log_validation_failure("DNS RESOLUTION VALIDATION FAILED", problems)
@@ -213,21 +216,20 @@ def assert_tls_secrets_valid(core_v1, secret_info_list, namespace='nonprod'):
     all_problems = []
     cert_infos = []
     
-    for idx, app in enumerate(secret_info_list, 1):
+    results = validate_certificate_secrets(
+        core_v1,
+        [(app['secret_name'], namespace, app['hostname']) for app in secret_info_list]
+    )
+    
+    for idx, (app, (problems, cert_info)) in enumerate(zip(secret_info_list, results), 1):
         logger.info(f"[{idx}/{len(secret_info_list)}] Validating TLS secret: {app['secret_name']}")
         logger.info(f"      Hostname: {app['hostname']}")
         
-        problems, cert_info = validate_certificate_secret(
-            core_v1,
-            secret_name=app['secret_name'],
-            namespace=namespace,
-            expected_hostname=app['hostname']
-        )
-        
         if problems:
             logger.info(f"      ✗ Secret validation failed")
             all_problems.extend(problems)
         else:
+            log_certificate_info(cert_info)
             logger.info(f"      ✓ TLS secret is valid")
             cert_infos.append(cert_info)
         
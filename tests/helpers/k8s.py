@@ -12,17 +12,37 @@ Functions are organized into categories:
 - Certificate validation
 - HTTP endpoint validation
 """
+import re
+import json
 import time
+import base64
+import random
+import asyncio
+import functools
 import logging
 import ssl
 import socket
+import ipaddress
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from kubernetes import watch
+from kubernetes.client import V1Job, V1ObjectMeta, V1OwnerReference
 from kubernetes.client.rest import ApiException
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +53,52 @@ logger = logging.getLogger(__name__)
 # Polling configuration for all wait operations
 DEFAULT_POLL_INTERVAL = 15  # seconds between status checks
 DEFAULT_TIMEOUT = 600  # 10 minutes max wait time
+JOB_API_RETRY_DELAY = 5  # seconds before retrying a failed job list/watch
+
+# resourceVersion="0" lets the apiserver answer LISTs from its watch cache
+# instead of a quorum read from etcd. Used by read-only validators where a
+# slightly stale view is acceptable (the next poll catches up).
+CACHED_RESOURCE_VERSION = "0"
+
+# DNS query limits for ingress host resolution
+DNS_TIMEOUT = 2  # seconds per nameserver attempt
+DNS_LIFETIME = 4  # seconds total per query
+DNS_MAX_CONCURRENCY = 64  # in-flight async queries
+DNS_CACHE_MAX_TTL = 300  # upper bound on cached answer lifetime (seconds)
+DNS_CACHE_NEGATIVE_TTL = 30  # lifetime of cached NXDOMAIN/NoAnswer (seconds)
+DNS_CACHE_MAX_ENTRIES = 4096  # cached lookups kept before evicting the least recently used
+
+# Page size for chunked Ingress LISTs (limit/continue)
+INGRESS_PAGE_SIZE = 500
+
+# Order name referenced in CertificateRequest condition messages
+# (e.g., 'order resource "order-name-123"')
+_ORDER_RE = re.compile(r'''order resource ["']([^"']+)["']''', re.IGNORECASE)
+
+# Certificate OIDs read when validating TLS secrets
+_CN_OID = x509.oid.NameOID.COMMON_NAME
+_ORG_OID = x509.oid.NameOID.ORGANIZATION_NAME
+_SAN_OID = x509.oid.ExtensionOID.SUBJECT_ALTERNATIVE_NAME
+
+# Parallel secret reads in validate_certificate_secrets
+CERT_SECRET_WORKERS = 8
+
+# Connection pool for the HTTP validators
+HTTP_POOL_SIZE = 32
+
+# Concurrent validations in validate_http_debug_apps / validate_whoami_env_vars_many
+HTTP_VALIDATION_WORKERS = 16
+
+# Certificate polling fallback: exponential backoff with jitter
+CERT_POLL_MIN_INTERVAL = 2  # seconds; also used for the first polls
+CERT_POLL_MAX_INTERVAL = 30  # seconds; backoff cap
+CERT_POLL_FAST_ATTEMPTS = 3  # polls at the minimum interval before backing off
+
+# Metadata-only LIST responses, with a full-object fallback
+PARTIAL_METADATA_LIST_ACCEPT = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+
+# Server-side Table view (printer columns only), with a full-object fallback
+TABLE_LIST_ACCEPT = 'application/json;as=Table;g=meta.k8s.io;v=v1,application/json'
 
 
 # =============================================================================
@@ -52,7 +118,7 @@ def get_platform_namespaces(core_v1, namespace_filter=None):
     """
     if namespace_filter:
         return [namespace_filter]
-    all_ns = core_v1.list_namespace()
+    all_ns = core_v1.list_namespace(resource_version=CACHED_RESOURCE_VERSION)
     return [ns.metadata.name for ns in all_ns.items 
             if ns.metadata.name.startswith("glueops-") or ns.metadata.name == "nonprod"]
 
@@ -61,10 +127,58 @@ def get_platform_namespaces(core_v1, namespace_filter=None):
 # JOB/POD VALIDATION
 # =============================================================================
 
+def create_job_from_cronjob(batch_v1, cronjob, job_name, namespace):
+    """
+    Create a Job from a CronJob's template (like `kubectl create job --from`).
+    
+    The Job gets the template's labels/annotations and spec, the
+    cronjob.kubernetes.io/instantiate=manual annotation, and an owner
+    reference to the CronJob so it is garbage-collected with it.
+    
+    Args:
+        batch_v1: Kubernetes BatchV1Api client
+        cronjob: V1CronJob to instantiate
+        job_name: Name for the new Job
+        namespace: Namespace to create the Job in
+    
+    Returns:
+        V1Job: The created Job
+    
+    Raises:
+        ApiException: If the API server rejects the Job
+    """
+    template = cronjob.spec.job_template
+    template_metadata = template.metadata or V1ObjectMeta()
+    annotations = dict(template_metadata.annotations or {})
+    annotations['cronjob.kubernetes.io/instantiate'] = 'manual'
+    
+    job = V1Job(
+        api_version="batch/v1",
+        kind="Job",
+        metadata=V1ObjectMeta(
+            name=job_name,
+            labels=template_metadata.labels,
+            annotations=annotations,
+            owner_references=[V1OwnerReference(
+                api_version="batch/v1",
+                kind="CronJob",
+                name=cronjob.metadata.name,
+                uid=cronjob.metadata.uid,
+                controller=True,
+            )],
+        ),
+        spec=template.spec,
+    )
+    return batch_v1.create_namespaced_job(namespace=namespace, body=job)
+
+
 def wait_for_job_completion(batch_v1, job_name, namespace):
     """
     Wait for a job to complete and return its status.
     
+    Watches the single job (see wait_for_jobs_completion) instead of
+    polling it, so completion is seen as soon as the status changes.
+    
     Args:
         batch_v1: Kubernetes BatchV1Api client
         job_name: Name of the Job resource
@@ -73,20 +187,90 @@ def wait_for_job_completion(batch_v1, job_name, namespace):
     Returns:
         str: 'succeeded', 'failed', or 'timeout'
     """
-    start_time = time.time()
+    return wait_for_jobs_completion(batch_v1, [job_name], namespace)[0]
+
+
+def _job_outcome(job):
+    """Return 'succeeded' or 'failed' for a finished Job, else None."""
+    status = job.status
+    if status is None:
+        return None
+    if status.succeeded and status.succeeded > 0:
+        return "succeeded"
+    if status.failed and status.failed > 0:
+        return "failed"
+    return None
+
+
+def wait_for_jobs_completion(batch_v1, job_names, namespace, timeout=DEFAULT_TIMEOUT):
+    """
+    Wait for several jobs at once over a single watch.
     
-    while time.time() - start_time < DEFAULT_TIMEOUT:
-        try:
-            job = batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
-            if job.status.succeeded and job.status.succeeded > 0:
-                return "succeeded"
-            elif job.status.failed and job.status.failed > 0:
-                return "failed"
-        except ApiException:
-            pass
-        time.sleep(5)
+    One LIST records jobs that already finished, then one watch on the
+    namespace resolves the rest as their status changes, instead of each
+    job polling the API server on its own. The total wait is that of the
+    slowest job. API errors are retried after JOB_API_RETRY_DELAY seconds
+    until the timeout.
+    
+    Args:
+        batch_v1: Kubernetes BatchV1Api client
+        job_names: Names of the Job resources
+        namespace: Namespace of the Jobs
+        timeout: Maximum time to wait in seconds (default: DEFAULT_TIMEOUT)
+    
+    Returns:
+        list: 'succeeded', 'failed', or 'timeout' per job, in job_names order
+    """
+    outcomes = {}
+    pending = set(job_names)
+    deadline = time.monotonic() + timeout
+    
+    # A single job is listed and watched by name
+    selector = {'field_selector': f"metadata.name={job_names[0]}"} if len(pending) == 1 else {}
     
-    return "timeout"
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        
+        w = watch.Watch()
+        try:
+            # (Re)list to catch up, e.g. after the watch expired with 410 Gone
+            jobs = batch_v1.list_namespaced_job(namespace=namespace, **selector)
+            for job in jobs.items:
+                outcome = _job_outcome(job) if job.metadata.name in pending else None
+                if outcome:
+                    outcomes[job.metadata.name] = outcome
+                    pending.discard(job.metadata.name)
+            
+            if not pending:
+                break
+            
+            for event in w.stream(
+                batch_v1.list_namespaced_job,
+                namespace=namespace,
+                resource_version=jobs.metadata.resource_version,
+                timeout_seconds=max(1, int(remaining)),
+                **selector
+            ):
+                job = event['object']
+                if event['type'] == 'ERROR' or job.metadata.name not in pending:
+                    continue
+                outcome = _job_outcome(job)
+                if outcome:
+                    outcomes[job.metadata.name] = outcome
+                    pending.discard(job.metadata.name)
+                    if not pending:
+                        break
+        except ApiException as e:
+            # 410 Gone only means the watch expired; relist right away
+            if e.status != 410:
+                logger.debug(f"Job list/watch in {namespace} failed ({e.status}), retrying in {JOB_API_RETRY_DELAY}s")
+                time.sleep(max(0, min(JOB_API_RETRY_DELAY, deadline - time.monotonic())))
+        finally:
+            w.stop()
+    
+    return [outcomes.get(job_name, "timeout") for job_name in job_names]
 
 
 def validate_pod_execution(core_v1, job_name, namespace):
@@ -121,64 +305,129 @@ def validate_pod_execution(core_v1, job_name, namespace):
 # ARGOCD VALIDATION
 # =============================================================================
 
-def validate_all_argocd_apps(custom_api, namespace_filter=None):
+def _list_argocd_app_statuses(custom_api, namespace_filter=None):
     """
-    Check all ArgoCD applications for health and sync status.
+    List (namespace, name, health, sync) for every ArgoCD Application.
+    
+    Requests the server-side Table view, whose rows carry only the CRD's
+    'Health Status' and 'Sync Status' printer columns plus object
+    metadata, so the large spec.source.helm.values and status.history
+    payloads are never transferred. Falls back to full objects if the
+    server or CRD doesn't provide those columns.
     
     Args:
         custom_api: Kubernetes CustomObjectsApi client
-        namespace_filter: Optional namespace filter for ArgoCD apps
+        namespace_filter: Optional namespace to list instead of the cluster
     
     Returns:
-        list: List of problem descriptions (empty if all healthy)
-    """
-    logger.info("Checking ArgoCD applications...")
+        list: (namespace, name, health, sync) tuples
     
-    problems = []
-    
-    try:
+    Raises:
+        ApiException: If the list call fails
+    """
+    if namespace_filter:
+        path = f'/apis/argoproj.io/v1alpha1/namespaces/{namespace_filter}/applications'
+    else:
+        path = '/apis/argoproj.io/v1alpha1/applications'
+    
+    response = custom_api.api_client.call_api(
+        path, 'GET',
+        path_params={},
+        query_params=[('resourceVersion', CACHED_RESOURCE_VERSION)],
+        header_params={'Accept': TABLE_LIST_ACCEPT},
+        response_type='object',
+        auth_settings=['BearerToken'],
+        _return_http_data_only=True,
+        _request_timeout=60
+    )
+    
+    if response.get('kind') == 'Table':
+        columns = [column['name'] for column in response.get('columnDefinitions', [])]
+        if 'Health Status' in columns and 'Sync Status' in columns:
+            health_idx = columns.index('Health Status')
+            sync_idx = columns.index('Sync Status')
+            statuses = []
+            for row in response.get('rows') or []:
+                metadata = row['object']['metadata']
+                cells = row['cells']
+                statuses.append((
+                    metadata.get('namespace'),
+                    metadata['name'],
+                    cells[health_idx] or 'Unknown',
+                    cells[sync_idx] or 'Unknown',
+                ))
+            return statuses
+        
+        # No printer columns to read the statuses from; fetch full objects
         if namespace_filter:
-            apps = custom_api.list_namespaced_custom_object(
+            response = custom_api.list_namespaced_custom_object(
                 group="argoproj.io",
                 version="v1alpha1",
                 namespace=namespace_filter,
-                plural="applications"
+                plural="applications",
+                resource_version=CACHED_RESOURCE_VERSION
             )
         else:
-            apps = custom_api.list_cluster_custom_object(
+            response = custom_api.list_cluster_custom_object(
                 group="argoproj.io",
                 version="v1alpha1",
-                plural="applications"
+                plural="applications",
+                resource_version=CACHED_RESOURCE_VERSION
             )
+    
+    statuses = []
+    for app in response.get('items') or []:
+        metadata = app['metadata']
+        status = app.get('status') or {}
+        statuses.append((
+            metadata['namespace'],
+            metadata['name'],
+            (status.get('health') or {}).get('status', 'Unknown'),
+            (status.get('sync') or {}).get('status', 'Unknown'),
+        ))
+    return statuses
+
+
+def validate_all_argocd_apps(custom_api, namespace_filter=None):
+    """
+    Check all ArgoCD applications for health and sync status.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        namespace_filter: Optional namespace filter for ArgoCD apps
+    
+    Returns:
+        list: List of problem descriptions (empty if all healthy)
+    """
+    logger.info("Checking ArgoCD applications...")
+    
+    problems = []
+    
+    try:
+        apps = _list_argocd_app_statuses(custom_api, namespace_filter)
     except ApiException as e:
         problems.append(f"Failed to list ArgoCD applications: {e}")
         return problems
     
-    if not apps.get('items'):
+    if not apps:
         logger.info("  No ArgoCD applications found")
         return problems
     
-    total_apps = len(apps['items'])
+    total_apps = len(apps)
     healthy_count = 0
     
-    for app in apps['items']:
-        name = app['metadata']['name']
-        namespace = app['metadata']['namespace']
-        status = app.get('status', {})
-        health = status.get('health', {}).get('status', 'Unknown')
-        sync = status.get('sync', {}).get('status', 'Unknown')
-        
-        if health != 'Healthy':
-            problems.append(f"{namespace}/{name}: Health={health} (expected Healthy)")
-        
-        if sync != 'Synced':
-            problems.append(f"{namespace}/{name}: Sync={sync} (expected Synced)")
-        
+    for namespace, name, health, sync in apps:
         if health == 'Healthy' and sync == 'Synced':
             healthy_count += 1
+            status_icon = "✓"
+        else:
+            if health != 'Healthy':
+                problems.append(f"{namespace}/{name}: Health={health} (expected Healthy)")
+            if sync != 'Synced':
+                problems.append(f"{namespace}/{name}: Sync={sync} (expected Synced)")
+            status_icon = "✗"
         
-        status_icon = "✓" if (health == 'Healthy' and sync == 'Synced') else "✗"
-        logger.info(f"  {status_icon} {namespace}/{name}: Health={health}, Sync={sync}")
+        logger.info("  %s %s/%s: Health=%s, Sync=%s", status_icon, namespace, name, health, sync)
     
     if not problems:
         logger.info(f"  All {total_apps} applications healthy and synced")
@@ -210,7 +459,8 @@ def wait_for_argocd_apps_deleted(custom_api, namespace: str) -> bool:
                 group="argoproj.io",
                 version="v1alpha1",
                 namespace=namespace,
-                plural="applications"
+                plural="applications",
+                resource_version=CACHED_RESOURCE_VERSION
             )
             
             app_count = len(apps.get('items', []))
@@ -383,6 +633,49 @@ def force_sync_argocd_app(custom_api, app_name, namespace="glueops-core"):
             raise
 
 
+def _wait_for_app_change(custom_api, app_name, namespace, resource_version, timeout):
+    """
+    Block until an ArgoCD application changes past a resourceVersion.
+    
+    Replaces a sleep-then-GET poll with a watch scoped to a single
+    application, so unchanged apps cost no GET or JSON decode.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        app_name: Name of the ArgoCD Application to watch
+        namespace: Namespace where the Application resource exists
+        resource_version: Last seen metadata.resourceVersion
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        dict | None: Updated application object, or None if unchanged
+    
+    Raises:
+        ApiException: 404 if the application is deleted, 410 if
+            resource_version is too old to resume from
+    """
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            custom_api.list_namespaced_custom_object,
+            group="argoproj.io",
+            version="v1alpha1",
+            namespace=namespace,
+            plural="applications",
+            field_selector=f"metadata.name={app_name}",
+            resource_version=resource_version,
+            timeout_seconds=timeout
+        ):
+            if event['type'] == 'DELETED':
+                raise ApiException(status=404, reason="Not Found")
+            if event['type'] in ('ADDED', 'MODIFIED'):
+                return event['object']
+    finally:
+        w.stop()
+    
+    return None
+
+
 def wait_for_argocd_app_healthy(custom_api, app_name, namespace="glueops-core", allow_missing=False, timeout=DEFAULT_TIMEOUT):
     """
     Wait for an ArgoCD application to become Healthy and Synced.
@@ -405,16 +698,19 @@ def wait_for_argocd_app_healthy(custom_api, app_name, namespace="glueops-core",
     last_error_type = None
     consecutive_good_checks = 0
     required_consecutive_checks = 2  # Need 2 consecutive good checks to be sure
+    last_good_check = None  # when the last counted good check happened
+    app = None
     
     while time.time() - start_time < timeout:
         try:
-            app = custom_api.get_namespaced_custom_object(
-                group="argoproj.io",
-                version="v1alpha1",
-                namespace=namespace,
-                plural="applications",
-                name=app_name
-            )
+            if app is None:
+                app = custom_api.get_namespaced_custom_object(
+                    group="argoproj.io",
+                    version="v1alpha1",
+                    namespace=namespace,
+                    plural="applications",
+                    name=app_name
+                )
             
             status = app.get('status', {})
             health_status = status.get('health', {}).get('status', 'Unknown')
@@ -437,16 +733,20 @@ def wait_for_argocd_app_healthy(custom_api, app_name, namespace="glueops-core",
                 (health_status == 'Missing' and sync_status == 'Synced' and not has_resources)
             )
             
-            if is_healthy:
+            # Good checks only count DEFAULT_POLL_INTERVAL apart: the watch
+            # returns on the first change, which may follow right after
+            if is_healthy and (last_good_check is None or time.time() - last_good_check >= DEFAULT_POLL_INTERVAL):
                 consecutive_good_checks += 1
+                last_good_check = time.time()
                 if consecutive_good_checks >= required_consecutive_checks:
                     state_desc = "Healthy/Synced" if health_status == 'Healthy' else "Synced (no resources)"
                     logger.info(f"✓ Application '{app_name}' is {state_desc}")
                     return True
                 else:
                     logger.info(f"  {app_name}: {health_status}/{sync_status} (confirming... {consecutive_good_checks}/{required_consecutive_checks})")
-            else:
+            elif not is_healthy:
                 consecutive_good_checks = 0
+                last_good_check = None
                 
                 # Log sync errors if present
                 if sync_errors:
@@ -458,10 +758,20 @@ def wait_for_argocd_app_healthy(custom_api, app_name, namespace="glueops-core",
                     elapsed = int(time.time() - start_time)
                     logger.info(f"  {app_name}: {health_status}/{sync_status} (resources: {len(resources)}, {elapsed}s elapsed)")
             
-            time.sleep(DEFAULT_POLL_INTERVAL)
+            # Wait for the next change instead of re-fetching an unchanged app
+            changed = _wait_for_app_change(
+                custom_api, app_name, namespace,
+                app['metadata'].get('resourceVersion'),
+                DEFAULT_POLL_INTERVAL
+            )
+            if changed is not None:
+                app = changed
             
         except ApiException as e:
-            if e.status == 404:
+            if e.status == 410:
+                # resourceVersion expired - fall back to a fresh GET
+                app = None
+            elif e.status == 404:
                 if allow_missing:
                     logger.info(f"✓ Application '{app_name}' not found (treated as success)")
                     return True
@@ -481,6 +791,30 @@ def wait_for_argocd_app_healthy(custom_api, app_name, namespace="glueops-core",
 # POD HEALTH VALIDATION
 # =============================================================================
 
+def _oom_reason(container_status):
+    """
+    Return the OOMKilled problem label for a container, if any.
+    
+    The current state takes precedence over the last terminated state so
+    each container is reported at most once.
+    
+    Args:
+        container_status: V1ContainerStatus from a pod
+    
+    Returns:
+        str | None: 'Currently OOMKilled', 'OOMKilled', or None
+    """
+    state = container_status.state
+    if state and state.terminated and state.terminated.reason == 'OOMKilled':
+        return 'Currently OOMKilled'
+    
+    last_state = container_status.last_state
+    if last_state and last_state.terminated and last_state.terminated.reason == 'OOMKilled':
+        return 'OOMKilled'
+    
+    return None
+
+
 def validate_pod_health(core_v1, platform_namespaces):
     """
     Check pod health across platform namespaces.
@@ -506,7 +840,7 @@ def validate_pod_health(core_v1, platform_namespaces):
     healthy_pods = 0
     
     for namespace in platform_namespaces:
-        pods = core_v1.list_namespaced_pod(namespace=namespace)
+        pods = core_v1.list_namespaced_pod(namespace=namespace, resource_version=CACHED_RESOURCE_VERSION)
         
         if not pods.items:
             continue
@@ -542,17 +876,11 @@ def validate_pod_health(core_v1, platform_namespaces):
                         problems.append(f"{namespace}/{pod_name}/{container_name}: {reason}")
                         pod_has_issues = True
                 
-                # Check last terminated state for OOMKilled
-                if container_status.last_state and container_status.last_state.terminated:
-                    if container_status.last_state.terminated.reason == 'OOMKilled':
-                        problems.append(f"{namespace}/{pod_name}/{container_name}: OOMKilled")
-                        pod_has_issues = True
-                
-                # Check current terminated state for OOMKilled
-                if container_status.state and container_status.state.terminated:
-                    if container_status.state.terminated.reason == 'OOMKilled':
-                        problems.append(f"{namespace}/{pod_name}/{container_name}: Currently OOMKilled")
-                        pod_has_issues = True
+                # Check current and last terminated state for OOMKilled
+                oom = _oom_reason(container_status)
+                if oom:
+                    problems.append(f"{namespace}/{pod_name}/{container_name}: {oom}")
+                    pod_has_issues = True
             
             if pod_has_issues:
                 logger.info(f"  ✗ {namespace}/{pod_name}: Issues found")
@@ -594,7 +922,7 @@ def validate_failed_jobs(batch_v1, platform_namespaces, exclude_jobs=None):
     failed_jobs = 0
     
     for namespace in platform_namespaces:
-        jobs = batch_v1.list_namespaced_job(namespace=namespace)
+        jobs = batch_v1.list_namespaced_job(namespace=namespace, resource_version=CACHED_RESOURCE_VERSION)
         
         for job in jobs.items:
             total_jobs += 1
@@ -635,7 +963,109 @@ def validate_failed_jobs(batch_v1, platform_namespaces, exclude_jobs=None):
 # INGRESS VALIDATION
 # =============================================================================
 
-def validate_ingress_configuration(networking_v1, platform_namespaces):
+def _iter_ingresses(networking_v1, namespace=None, page_size=INGRESS_PAGE_SIZE):
+    """
+    Yield Ingresses page by page using the LIST limit/continue parameters.
+    
+    Keeps each apiserver response bounded to page_size objects instead of
+    returning every Ingress in one response.
+    
+    Args:
+        networking_v1: Kubernetes NetworkingV1Api client
+        namespace: Namespace to list (default: all namespaces)
+        page_size: Maximum objects per LIST call (default: INGRESS_PAGE_SIZE)
+    
+    Yields:
+        V1Ingress: Each Ingress in turn
+    """
+    continue_token = None
+    
+    while True:
+        kwargs = {'limit': page_size, '_request_timeout': 30}
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        
+        if namespace:
+            response = networking_v1.list_namespaced_ingress(namespace=namespace, **kwargs)
+        else:
+            response = networking_v1.list_ingress_for_all_namespaces(**kwargs)
+        
+        yield from response.items
+        
+        continue_token = response.metadata._continue
+        if not continue_token:
+            return
+
+
+def _normalize_ns(namespaces):
+    """
+    Return namespaces as a frozenset for O(1) membership tests.
+    
+    Args:
+        namespaces: Iterable of namespace names (a frozenset is returned as-is)
+    
+    Returns:
+        frozenset: Namespace names
+    """
+    if isinstance(namespaces, frozenset):
+        return namespaces
+    return frozenset(namespaces)
+
+
+def list_platform_ingresses(networking_v1, platform_namespaces):
+    """
+    List Ingresses in the platform namespaces with a single API call.
+    
+    Uses one all-namespaces LIST and filters client-side instead of one
+    LIST per namespace. The result can be passed to the ingress validators
+    so they don't each re-list.
+    
+    Args:
+        networking_v1: Kubernetes NetworkingV1Api client
+        platform_namespaces: List of namespaces to include
+    
+    Returns:
+        list: V1Ingress objects in the given namespaces
+    """
+    ns_set = _normalize_ns(platform_namespaces)
+    return [i for i in _iter_ingresses(networking_v1) if i.metadata.namespace in ns_set]
+
+
+# Flattened view of the Ingress fields both validators read
+IngressView = namedtuple('IngressView', 'name namespace hosts lb_ips lb_hostnames')
+
+
+def _project(ingress):
+    """
+    Project an Ingress onto an IngressView, doing the None-checks once.
+    
+    hosts holds every rule's host in rule order (empty values included so
+    callers can report the rule index). lb_ips/lb_hostnames are None when
+    the Ingress has no load balancer status at all.
+    
+    Args:
+        ingress: V1Ingress object
+    
+    Returns:
+        IngressView | None: Projected view, or None if the Ingress has no spec
+    """
+    if not ingress.spec:
+        return None
+    
+    hosts = tuple(rule.host for rule in ingress.spec.rules or ())
+    
+    status = ingress.status
+    if not status or not status.load_balancer:
+        lb_ips = lb_hostnames = None
+    else:
+        lb_ingress = status.load_balancer.ingress or ()
+        lb_ips = tuple(lb.ip for lb in lb_ingress if lb.ip)
+        lb_hostnames = tuple(lb.hostname for lb in lb_ingress if lb.hostname)
+    
+    return IngressView(ingress.metadata.name, ingress.metadata.namespace, hosts, lb_ips, lb_hostnames)
+
+
+def validate_ingress_configuration(networking_v1, platform_namespaces, ingresses=None):
     """
     Validate Ingress resources have proper configuration.
     
@@ -647,6 +1077,7 @@ def validate_ingress_configuration(networking_v1, platform_namespaces):
     Args:
         networking_v1: Kubernetes NetworkingV1Api client
         platform_namespaces: List of namespaces to check
+        ingresses: Optional prefetched list from list_platform_ingresses()
     
     Returns:
         tuple: (problems, total_ingresses)
@@ -656,50 +1087,44 @@ def validate_ingress_configuration(networking_v1, platform_namespaces):
     problems = []
     total_ingresses = 0
     
-    for namespace in platform_namespaces:
-        ingresses = networking_v1.list_namespaced_ingress(namespace=namespace)
+    if ingresses is None:
+        ingresses = list_platform_ingresses(networking_v1, platform_namespaces)
+    
+    for ingress in ingresses:
+        total_ingresses += 1
+        name = f"{ingress.metadata.namespace}/{ingress.metadata.name}"
+        view = _project(ingress)
         
-        for ingress in ingresses.items:
-            total_ingresses += 1
-            name = f"{namespace}/{ingress.metadata.name}"
-            
-            # Check if spec exists
-            if not ingress.spec:
-                problems.append(f"{name}: Missing spec")
-                logger.info(f"  ✗ {name}: Missing spec")
-                continue
-            
-            # Check if rules exist
-            if not ingress.spec.rules:
-                problems.append(f"{name}: No rules defined")
-                logger.info(f"  ✗ {name}: No rules defined")
-                continue
-            
-            # Check each rule for host
-            for i, rule in enumerate(ingress.spec.rules):
-                if not rule.host or rule.host.strip() == "":
-                    problems.append(f"{name}: Rule {i} has empty host")
-                    logger.info(f"  ✗ {name}: Rule {i} has empty host")
-            
-            # Check load balancer status
-            if not ingress.status or not ingress.status.load_balancer:
-                problems.append(f"{name}: No load balancer status")
-                logger.info(f"  ✗ {name}: No load balancer status")
-                continue
-            
-            lb_ingress = ingress.status.load_balancer.ingress
-            if not lb_ingress:
-                problems.append(f"{name}: Load balancer has no ingress")
-                logger.info(f"  ✗ {name}: Load balancer has no ingress")
-                continue
-            
-            # Check if at least one LB ingress has IP or hostname
-            has_address = any(lb.ip or lb.hostname for lb in lb_ingress)
-            if not has_address:
-                problems.append(f"{name}: Load balancer has no IP or hostname")
-                logger.info(f"  ✗ {name}: Load balancer has no IP or hostname")
-            else:
-                logger.info(f"  ✓ {name}: Valid configuration")
+        # Check if spec exists
+        if view is None:
+            problems.append(f"{name}: Missing spec")
+            logger.info(f"  ✗ {name}: Missing spec")
+            continue
+        
+        # Check if rules exist
+        if not view.hosts:
+            problems.append(f"{name}: No rules defined")
+            logger.info(f"  ✗ {name}: No rules defined")
+            continue
+        
+        # Check each rule for host
+        for i, host in enumerate(view.hosts):
+            if not host or host.strip() == "":
+                problems.append(f"{name}: Rule {i} has empty host")
+                logger.info(f"  ✗ {name}: Rule {i} has empty host")
+        
+        # Check load balancer status
+        if view.lb_ips is None:
+            problems.append(f"{name}: No load balancer status")
+            logger.info(f"  ✗ {name}: No load balancer status")
+            continue
+        
+        # Check if at least one LB ingress has IP or hostname
+        if not view.lb_ips and not view.lb_hostnames:
+            problems.append(f"{name}: Load balancer has no IP or hostname")
+            logger.info(f"  ✗ {name}: Load balancer has no IP or hostname")
+        else:
+            logger.info(f"  ✓ {name}: Valid configuration")
     
     if not problems:
         logger.info(f"  All {total_ingresses} ingresses properly configured")
@@ -707,141 +1132,315 @@ def validate_ingress_configuration(networking_v1, platform_namespaces):
     return problems, total_ingresses
 
 
-def validate_ingress_dns(networking_v1, platform_namespaces, dns_server='1.1.1.1'):
+# (host, rdtype, nameservers) -> (expiry, answer, error), least recently used first
+_DNS_CACHE = OrderedDict()
+
+
+def _dns_cache_get(key):
     """
-    Validate DNS resolution for Ingress hosts.
-    
-    For each ingress with a load balancer:
-    - If LB has IP: Queries DNS A records and compares resolved IPs
-    - If LB has hostname: Queries DNS CNAME records and validates CNAME points to LB hostname
+    Return an unexpired (expiry, answer, error) cache entry, or None.
     
     Args:
-        networking_v1: Kubernetes NetworkingV1Api client
-        platform_namespaces: List of namespaces to check
-        dns_server: DNS server to query (default: '1.1.1.1')
+        key: (host, rdtype, nameservers) tuple
     
     Returns:
-        tuple: (problems, checked_count)
+        tuple | None: Cached entry if still valid
     """
-    logger.info(f"Validating DNS resolution (using {dns_server})...")
-    
-    problems = []
-    checked_count = 0
-    resolver = dns.resolver.Resolver()
-    resolver.nameservers = [dns_server]
-    
-    for namespace in platform_namespaces:
-        ingresses = networking_v1.list_namespaced_ingress(namespace=namespace)
-        
-        for ingress in ingresses.items:
-            name = f"{namespace}/{ingress.metadata.name}"
-            
-            # Get expected IPs or hostnames from load balancer
-            if not ingress.status or not ingress.status.load_balancer or not ingress.status.load_balancer.ingress:
-                continue
-            
-            expected_ips = []
-            expected_hostnames = []
-            for lb in ingress.status.load_balancer.ingress:
-                if lb.ip:
-                    expected_ips.append(lb.ip)
-                if lb.hostname:
-                    expected_hostnames.append(lb.hostname)
-            
-            # Skip if no IPs or hostnames found
-            if not expected_ips and not expected_hostnames:
-                continue
-            
-            # Determine validation mode: CNAME for hostnames, A records for IPs
-            use_cname_validation = bool(expected_hostnames) and not expected_ips
-            
-            # Check each host
-            if not ingress.spec or not ingress.spec.rules:
-                continue
-            
-            for rule in ingress.spec.rules:
-                if not rule.host:
-                    continue
-                
-                checked_count += 1
-                host = rule.host
-                
-                if use_cname_validation:
-                    # Validate CNAME points to load balancer hostname (AWS ELB/ALB/NLB)
-                    try:
-                        answers = resolver.resolve(host, 'CNAME')
-                        cname_targets = [str(rdata.target).rstrip('.') for rdata in answers]
-                        
-                        # Check if any CNAME matches expected hostname
-                        if any(cname in expected_hostnames or any(cname == expected.rstrip('.') for expected in expected_hostnames) for cname in cname_targets):
-                            logger.info(f"  ✓ {host}: CNAME → {cname_targets[0]}")
-                        else:
-                            problems.append(f"{name} ({host}): CNAME points to {cname_targets}, expected {expected_hostnames}")
-                            logger.info(f"  ✗ {host}: CNAME → {cname_targets} (expected {expected_hostnames})")
-                            
-                    except dns.resolver.NXDOMAIN:
-                        problems.append(f"{name} ({host}): NXDOMAIN (does not exist)")
-                        logger.info(f"  ✗ {host}: NXDOMAIN")
-                    except dns.resolver.NoAnswer:
-                        problems.append(f"{name} ({host}): No CNAME records")
-                        logger.info(f"  ✗ {host}: No CNAME records")
-                    except Exception as e:
-                        problems.append(f"{name} ({host}): DNS error - {e}")
-                        logger.info(f"  ✗ {host}: {e}")
-                else:
-                    # Validate A record points to load balancer IP (GCP, K3d)
-                    try:
-                        answers = resolver.resolve(host, 'A')
-                        resolved_ips = [str(rdata) for rdata in answers]
-                        
-                        # Check if any resolved IP matches expected
-                        if not any(ip in expected_ips for ip in resolved_ips):
-                            problems.append(f"{name} ({host}): Resolves to {resolved_ips}, expected {expected_ips}")
-                            logger.info(f"  ✗ {host}: A → {resolved_ips} (expected {expected_ips})")
-                        else:
-                            logger.info(f"  ✓ {host}: A → {resolved_ips[0]}")
-                            
-                    except dns.resolver.NXDOMAIN:
-                        problems.append(f"{name} ({host}): NXDOMAIN (does not exist)")
-                        logger.info(f"  ✗ {host}: NXDOMAIN")
-                    except dns.resolver.NoAnswer:
-                        problems.append(f"{name} ({host}): No A records")
-                        logger.info(f"  ✗ {host}: No A records")
-                    except Exception as e:
-                        problems.append(f"{name} ({host}): DNS error - {e}")
-                        logger.info(f"  ✗ {host}: {e}")
+    entry = _DNS_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        _DNS_CACHE.pop(key, None)
+        return None
+    _DNS_CACHE.move_to_end(key)
+    return entry
+
+
+def _dns_cache_put(key, answer, error=None):
+    """
+    Cache a DNS answer for its TTL, or a negative result for a short time.
     
-    if not problems:
-        logger.info(f"  All {checked_count} hosts resolve correctly")
+    Only NXDOMAIN/NoAnswer are cached negatively; timeouts and other
+    errors are left uncached so the next lookup retries. Once the cache
+    holds more than DNS_CACHE_MAX_ENTRIES, expired entries are dropped
+    first, then the least recently used.
     
-    return problems, checked_count
+    Args:
+        key: (host, rdtype, nameservers) tuple
+        answer: dns.resolver.Answer (None for errors)
+        error: Exception raised by the query (optional)
+    """
+    if error is None:
+        ttl = min(answer.rrset.ttl, DNS_CACHE_MAX_TTL)
+    elif isinstance(error, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)):
+        ttl = DNS_CACHE_NEGATIVE_TTL
+    else:
+        return
+    now = time.monotonic()
+    _DNS_CACHE[key] = (now + ttl, answer, error)
+    _DNS_CACHE.move_to_end(key)
+    
+    if len(_DNS_CACHE) > DNS_CACHE_MAX_ENTRIES:
+        for expired in [k for k, entry in _DNS_CACHE.items() if entry[0] <= now]:
+            del _DNS_CACHE[expired]
+        while len(_DNS_CACHE) > DNS_CACHE_MAX_ENTRIES:
+            _DNS_CACHE.popitem(last=False)
 
 
-def get_ingress_load_balancer_ip(networking_v1, ingress_class_name, namespace=None, fail_on_none=False):
+def cached_resolve(resolver, host, rdtype):
     """
-    Get the load balancer IP from ingresses matching the specified class.
-    
-    Supports both direct IP addresses (GCP, K3d) and hostnames (AWS ELB/ALB/NLB).
-    When a hostname is found, it will be resolved to an IP address.
+    Resolve a DNS record through the in-process TTL cache.
     
     Args:
-        networking_v1: Kubernetes NetworkingV1Api client
-        ingress_class_name: Ingress class name to filter by
-        namespace: Specific namespace to check (optional)
-        fail_on_none: Whether to fail test if IP not found (default: False)
+        resolver: dns.resolver.Resolver to query on a cache miss
+        host: Hostname to resolve
+        rdtype: Record type (e.g., 'A', 'CNAME')
     
     Returns:
-        str: Load balancer IP or None
+        dns.resolver.Answer: Resolved answer
+    
+    Raises:
+        dns.exception.DNSException: On resolution failure (cached
+            NXDOMAIN/NoAnswer are re-raised)
     """
-    logger.info(f"Searching for load balancer IP (ingressClassName: {ingress_class_name})...")
+    key = (host, rdtype, tuple(resolver.nameservers))
+    entry = _dns_cache_get(key)
+    if entry:
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
     
     try:
-        if namespace:
-            ingresses = networking_v1.list_namespaced_ingress(namespace=namespace)
-        else:
-            ingresses = networking_v1.list_ingress_for_all_namespaces()
+        answer = resolver.resolve(host, rdtype)
+    except dns.exception.DNSException as e:
+        _dns_cache_put(key, None, e)
+        raise
+    
+    _dns_cache_put(key, answer)
+    return answer
+
+
+def _is_ip_literal(value):
+    """
+    Check whether a string is an IPv4 or IPv6 address literal.
+    
+    Args:
+        value: String to check
+    
+    Returns:
+        bool: True if value parses as an IP address
+    """
+    try:
+        ipaddress.ip_address(value)
+        return True
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _get_a_resolver():
+    """
+    Return the system-configured resolver for load balancer hostnames.
+    
+    Built once on first use, with bounded timeouts so a misbehaving name
+    can't stall a test on libc defaults. A missing configuration is
+    memoized too, so resolv.conf is only read once.
+    
+    Returns:
+        dns.resolver.Resolver | None: None if /etc/resolv.conf is missing
+            or lists no nameservers
+    """
+    try:
+        resolver = dns.resolver.Resolver()
+    except dns.resolver.NoResolverConfiguration:
+        return None
+    resolver.timeout = DNS_TIMEOUT
+    resolver.lifetime = DNS_LIFETIME
+    return resolver
+
+
+def _resolve_host(hostname):
+    """
+    Resolve a hostname to its first IPv4 address via the DNS cache.
+    
+    IP literals are returned unchanged without a DNS lookup. Only when
+    there is no resolv.conf does the name go through the system resolver
+    (which still reads /etc/hosts). A name DNS doesn't know
+    (NXDOMAIN/NoAnswer) is an error, not a reason to try elsewhere.
+    
+    Args:
+        hostname: Hostname or IP address to resolve
+    
+    Returns:
+        str: IP address
+    
+    Raises:
+        dns.exception.DNSException: If the name doesn't exist, has no A
+            record, or the query fails or times out
+        socket.gaierror: If there is no resolv.conf and the system
+            resolver cannot resolve the hostname
+    """
+    if _is_ip_literal(hostname):
+        return hostname
+    
+    resolver = _get_a_resolver()
+    if resolver is None:
+        return socket.gethostbyname(hostname)
+    
+    answers = cached_resolve(resolver, hostname, 'A')
+    return str(answers[0])
+
+
+async def _resolve_concurrently(queries, dns_server):
+    """
+    Resolve (host, rdtype) pairs concurrently against one nameserver.
+    
+    Args:
+        queries: List of (host, rdtype) tuples
+        dns_server: DNS server to query
+    
+    Returns:
+        list: (answer, error) tuples in the same order as queries
+    
+    Answers and NXDOMAIN/NoAnswer results are served from and stored in
+    the shared DNS cache.
+    """
+    resolver = dns.asyncresolver.Resolver(configure=False)
+    resolver.nameservers = [dns_server]
+    resolver.timeout = DNS_TIMEOUT
+    resolver.lifetime = DNS_LIFETIME
+    
+    # Bound in-flight queries; unbounded gathers can hang dnspython's async resolver
+    semaphore = asyncio.Semaphore(DNS_MAX_CONCURRENCY)
+    
+    nameservers = tuple(resolver.nameservers)
+    
+    async def _query(host, rdtype):
+        key = (host, rdtype, nameservers)
+        entry = _dns_cache_get(key)
+        if entry:
+            return entry[1], entry[2]
+        
+        async with semaphore:
+            try:
+                answer = await resolver.resolve(host, rdtype)
+            except Exception as e:
+                _dns_cache_put(key, None, e)
+                return None, e
+        
+        _dns_cache_put(key, answer)
+        return answer, None
+    
+    return await asyncio.gather(*(_query(host, rdtype) for host, rdtype in queries))
+
+
+def validate_ingress_dns(networking_v1, platform_namespaces, dns_server='1.1.1.1', ingresses=None):
+    """
+    Validate DNS resolution for Ingress hosts.
+    
+    For each ingress with a load balancer:
+    - If LB has IP: Queries DNS A records and compares resolved IPs
+    - If LB has hostname: Queries DNS CNAME records and validates CNAME points to LB hostname
+    
+    All hosts are resolved concurrently; matching runs afterwards in order.
+    
+    Args:
+        networking_v1: Kubernetes NetworkingV1Api client
+        platform_namespaces: List of namespaces to check
+        dns_server: DNS server to query (default: '1.1.1.1')
+        ingresses: Optional prefetched list from list_platform_ingresses()
+    
+    Returns:
+        tuple: (problems, checked_count)
+    """
+    logger.info(f"Validating DNS resolution (using {dns_server})...")
+    
+    problems = []
+    work = []  # (name, host, rdtype, expected_ips, expected_hostnames, expected_ip_set, expected_norm)
+    
+    if ingresses is None:
+        ingresses = list_platform_ingresses(networking_v1, platform_namespaces)
+    
+    for view in map(_project, ingresses):
+        # Skip ingresses without a spec or load balancer address
+        if view is None or not (view.lb_ips or view.lb_hostnames):
+            continue
+        
+        name = f"{view.namespace}/{view.name}"
         
-        for ingress in ingresses.items:
+        # Determine validation mode: CNAME for hostnames, A records for IPs
+        rdtype = 'CNAME' if view.lb_hostnames and not view.lb_ips else 'A'
+        
+        # Normalized once per ingress for O(1) membership tests below
+        expected_ip_set = frozenset(view.lb_ips)
+        expected_norm = frozenset(h.rstrip('.').lower() for h in view.lb_hostnames)
+        
+        for host in view.hosts:
+            if host:
+                work.append((name, host, rdtype, list(view.lb_ips), list(view.lb_hostnames), expected_ip_set, expected_norm))
+    
+    checked_count = len(work)
+    results = asyncio.run(_resolve_concurrently(
+        [(host, rdtype) for _, host, rdtype, *_ in work], dns_server
+    ))
+    
+    for (name, host, rdtype, expected_ips, expected_hostnames, expected_ip_set, expected_norm), (answers, error) in zip(work, results):
+        if isinstance(error, dns.resolver.NXDOMAIN):
+            problems.append(f"{name} ({host}): NXDOMAIN (does not exist)")
+            logger.info(f"  ✗ {host}: NXDOMAIN")
+        elif isinstance(error, dns.resolver.NoAnswer):
+            problems.append(f"{name} ({host}): No {rdtype} records")
+            logger.info(f"  ✗ {host}: No {rdtype} records")
+        elif error is not None:
+            problems.append(f"{name} ({host}): DNS error - {error}")
+            logger.info(f"  ✗ {host}: {error}")
+        elif rdtype == 'CNAME':
+            # Validate CNAME points to load balancer hostname (AWS ELB/ALB/NLB)
+            cname_targets = [str(rdata.target).rstrip('.') for rdata in answers]
+            
+            # Check if any CNAME matches expected hostname
+            if any(cname.lower() in expected_norm for cname in cname_targets):
+                logger.info(f"  ✓ {host}: CNAME → {cname_targets[0]}")
+            else:
+                problems.append(f"{name} ({host}): CNAME points to {cname_targets}, expected {expected_hostnames}")
+                logger.info(f"  ✗ {host}: CNAME → {cname_targets} (expected {expected_hostnames})")
+        else:
+            # Validate A record points to load balancer IP (GCP, K3d)
+            resolved_ips = [str(rdata) for rdata in answers]
+            
+            # Check if any resolved IP matches expected
+            if expected_ip_set.isdisjoint(resolved_ips):
+                problems.append(f"{name} ({host}): Resolves to {resolved_ips}, expected {expected_ips}")
+                logger.info(f"  ✗ {host}: A → {resolved_ips} (expected {expected_ips})")
+            else:
+                logger.info(f"  ✓ {host}: A → {resolved_ips[0]}")
+    
+    if not problems:
+        logger.info(f"  All {checked_count} hosts resolve correctly")
+    
+    return problems, checked_count
+
+
+def get_ingress_load_balancer_ip(networking_v1, ingress_class_name, namespace=None, fail_on_none=False):
+    """
+    Get the load balancer IP from ingresses matching the specified class.
+    
+    Supports both direct IP addresses (GCP, K3d) and hostnames (AWS ELB/ALB/NLB).
+    When a hostname is found, it will be resolved to an IP address.
+    
+    Args:
+        networking_v1: Kubernetes NetworkingV1Api client
+        ingress_class_name: Ingress class name to filter by
+        namespace: Specific namespace to check (optional)
+        fail_on_none: Whether to fail test if IP not found (default: False)
+    
+    Returns:
+        str: Load balancer IP or None
+    """
+    logger.info(f"Searching for load balancer IP (ingressClassName: {ingress_class_name})...")
+    
+    try:
+        for ingress in _iter_ingresses(networking_v1, namespace):
             if ingress.spec.ingress_class_name != ingress_class_name:
                 continue
             
@@ -855,13 +1454,18 @@ def get_ingress_load_balancer_ip(networking_v1, ingress_class_name, namespace=No
                         logger.info(f"✓ Found load balancer IP: {lb.ip}")
                         return lb.ip
                     
+                    # Some providers publish the address in the hostname field
+                    if lb.hostname and _is_ip_literal(lb.hostname):
+                        logger.info(f"✓ Found load balancer IP: {lb.hostname}")
+                        return lb.hostname
+                    
                     # Check for hostname (AWS ELB/ALB/NLB) and resolve to IP
                     if lb.hostname:
                         try:
-                            resolved_ip = socket.gethostbyname(lb.hostname)
+                            resolved_ip = _resolve_host(lb.hostname)
                             logger.info(f"✓ Resolved load balancer hostname {lb.hostname} → {resolved_ip}")
                             return resolved_ip
-                        except socket.gaierror as dns_error:
+                        except (dns.exception.DNSException, socket.gaierror) as dns_error:
                             logger.error(f"Failed to resolve load balancer hostname {lb.hostname}: {dns_error}")
                             if fail_on_none:
                                 import pytest
@@ -890,6 +1494,42 @@ def get_ingress_load_balancer_ip(networking_v1, ingress_class_name, namespace=No
 # CERTIFICATE VALIDATION
 # =============================================================================
 
+def _list_custom_object_metadata(custom_api, group, version, namespace, plural, label_selector=None):
+    """
+    List namespaced custom objects as PartialObjectMetadata.
+    
+    The apiserver returns only apiVersion/kind/metadata for each item, so
+    large spec/status payloads are never transferred or deserialized.
+    Falls back to full objects on servers that don't support the
+    PartialObjectMetadataList media type.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        group: API group (e.g., 'cert-manager.io')
+        version: API version (e.g., 'v1')
+        namespace: Namespace to list
+        plural: Resource plural (e.g., 'certificaterequests')
+        label_selector: Optional label selector
+    
+    Returns:
+        dict: List response with an 'items' key
+    """
+    query_params = []
+    if label_selector:
+        query_params.append(('labelSelector', label_selector))
+    
+    return custom_api.api_client.call_api(
+        f'/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'GET',
+        path_params={},
+        query_params=query_params,
+        header_params={'Accept': PARTIAL_METADATA_LIST_ACCEPT},
+        response_type='object',
+        auth_settings=['BearerToken'],
+        _return_http_data_only=True,
+        _request_timeout=30
+    )
+
+
 def _get_certificate_detailed_error(custom_api, cert_name, namespace, cert_message=""):
     """
     Fetch detailed error information from CertificateRequest and Order resources.
@@ -904,8 +1544,9 @@ def _get_certificate_detailed_error(custom_api, cert_name, namespace, cert_messa
         str: Detailed error message including ACME errors, or cert_message if details unavailable
     """
     try:
-        # List CertificateRequests for this certificate
-        cert_requests = custom_api.list_namespaced_custom_object(
+        # List CertificateRequests for this certificate (metadata only, no CSR blobs)
+        cert_requests = _list_custom_object_metadata(
+            custom_api,
             group="cert-manager.io",
             version="v1",
             namespace=namespace,
@@ -916,14 +1557,19 @@ def _get_certificate_detailed_error(custom_api, cert_name, namespace, cert_messa
         if not cert_requests.get('items'):
             return cert_message
         
-        # Sort by creation timestamp and get the most recent
-        sorted_requests = sorted(
+        # Get the most recent by creation timestamp, then fetch just that one in full
+        request_name = max(
             cert_requests['items'],
-            key=lambda x: x['metadata']['creationTimestamp'],
-            reverse=True
+            key=lambda x: x['metadata']['creationTimestamp']
+        )['metadata']['name']
+        
+        latest_request = custom_api.get_namespaced_custom_object(
+            group="cert-manager.io",
+            version="v1",
+            namespace=namespace,
+            plural="certificaterequests",
+            name=request_name
         )
-        latest_request = sorted_requests[0]
-        request_name = latest_request['metadata']['name']
         
         # Check CertificateRequest status for error details
         cr_status = latest_request.get('status', {})
@@ -941,14 +1587,11 @@ def _get_certificate_detailed_error(custom_api, cert_name, namespace, cert_messa
         # Try to get Order details if referenced
         order_name = None
         for condition in cr_conditions:
-            msg = condition.get('message', '')
             # Look for order name in message (e.g., 'order resource "order-name-123"')
-            if 'order resource' in msg.lower():
-                import re
-                match = re.search(r'order resource ["\']([^"\'\']+)["\']', msg, re.IGNORECASE)
-                if match:
-                    order_name = match.group(1)
-                    break
+            match = _ORDER_RE.search(condition.get('message', ''))
+            if match:
+                order_name = match.group(1)
+                break
         
         # Fetch Order details if we found a reference
         order_error = None
@@ -989,24 +1632,155 @@ def _get_certificate_detailed_error(custom_api, cert_name, namespace, cert_messa
         return cert_message
 
 
-def wait_for_certificate_ready(custom_api, cert_name, namespace, timeout=600, poll_interval=10):
+def _check_certificate_status(custom_api, cert, cert_name, namespace, elapsed):
     """
-    Wait for a cert-manager Certificate to reach Ready status.
+    Evaluate a Certificate object for Ready or terminal failure.
     
     Args:
         custom_api: Kubernetes CustomObjectsApi client
+        cert: Certificate object (dict)
         cert_name: Name of the Certificate resource
         namespace: Namespace of the Certificate
-        timeout: Maximum time to wait in seconds (default: 600)
-        poll_interval: Time between checks in seconds (default: 10)
+        elapsed: Seconds since waiting started (for logging)
     
     Returns:
-        tuple: (success: bool, status: dict)
+        tuple | None: (success, status) once Ready or failed, None to keep waiting
     """
-    start_time = time.time()
-    elapsed = 0
+    conditions = cert.get('status', {}).get('conditions', [])
+    
+    # Build a map of conditions for easier lookup
+    condition_map = {c.get('type'): c for c in conditions}
+    
+    # Check if certificate is Ready (success case)
+    ready_condition = condition_map.get('Ready')
+    if ready_condition and ready_condition.get('status') == 'True':
+        logger.info(f"      ✓ Certificate Ready (took {int(elapsed)}s)")
+        return True, cert.get('status', {})
+    
+    # Check Issuing condition for terminal failures
+    # When Issuing is False with reason "Failed", cert-manager has given up
+    issuing_condition = condition_map.get('Issuing')
+    if issuing_condition:
+        issuing_status = issuing_condition.get('status')
+        issuing_reason = issuing_condition.get('reason', '')
+        issuing_message = issuing_condition.get('message', 'No details')
+        
+        # Issuing condition with status False and reason Failed = terminal failure
+        if issuing_status == 'False' and issuing_reason in ['Failed', 'InvalidConfiguration', 'Denied']:
+            detailed_error = _get_certificate_detailed_error(
+                custom_api,
+                cert_name,
+                namespace,
+                f"Issuing {issuing_reason}: {issuing_message}"
+            )
+            
+            # Always log detailed errors on failure
+            logger.info(f"      ✗ Certificate FAILED (Issuing condition): {issuing_reason}")
+            logger.info(f"      📋 Details: {detailed_error}")
+            
+            status_with_error = cert.get('status', {})
+            status_with_error['detailed_error'] = detailed_error
+            return False, status_with_error
+    
+    # Check Ready condition for other terminal failures
+    # (e.g., configuration issues that prevent issuance from starting)
+    if ready_condition:
+        ready_reason = ready_condition.get('reason', 'Unknown')
+        ready_message = ready_condition.get('message', 'No details')
+        
+        # Some reasons in Ready condition also indicate terminal failures
+        if ready_reason in ['InvalidConfiguration', 'Denied']:
+            detailed_error = _get_certificate_detailed_error(
+                custom_api,
+                cert_name,
+                namespace,
+                f"Ready {ready_reason}: {ready_message}"
+            )
+            
+            logger.info(f"      ✗ Certificate FAILED (Ready condition): {ready_reason}")
+            logger.info(f"      📋 Details: {detailed_error}")
+            
+            status_with_error = cert.get('status', {})
+            status_with_error['detailed_error'] = detailed_error
+            return False, status_with_error
+        
+        # Not a terminal failure, log progress
+        logger.info(f"      ⏳ Status: {ready_reason} - {ready_message}")
+    else:
+        logger.info(f"      ⏳ Waiting for Ready condition... ({int(elapsed)}s elapsed)")
+    
+    return None
+
+
+def _watch_certificate(custom_api, cert_name, namespace, start_time, deadline):
+    """
+    Watch a Certificate until it is Ready, fails, or the deadline passes.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        cert_name: Name of the Certificate resource
+        namespace: Namespace of the Certificate
+        start_time: time.time() when waiting started
+        deadline: time.time() by which to give up
+    
+    Returns:
+        tuple | None: (success, status) once Ready or failed, None on timeout
+    
+    Raises:
+        ApiException: If the watch cannot be established
+    """
+    w = watch.Watch()
+    try:
+        # Re-open the watch if the server closes it before the deadline
+        while time.time() < deadline:
+            for event in w.stream(
+                custom_api.list_namespaced_custom_object,
+                group="cert-manager.io",
+                version="v1",
+                namespace=namespace,
+                plural="certificates",
+                field_selector=f"metadata.name={cert_name}",
+                timeout_seconds=max(1, int(deadline - time.time()))
+            ):
+                if event['type'] not in ('ADDED', 'MODIFIED'):
+                    continue
+                
+                result = _check_certificate_status(
+                    custom_api, event['object'], cert_name, namespace, time.time() - start_time
+                )
+                if result is not None:
+                    return result
+    finally:
+        w.stop()
+    
+    return None
+
+
+def _poll_certificate(custom_api, cert_name, namespace, start_time, deadline, poll_interval):
+    """
+    Poll a Certificate until it is Ready, fails, or the deadline passes.
+    
+    Fallback for when a watch on certificates cannot be established. The
+    first CERT_POLL_FAST_ATTEMPTS polls run CERT_POLL_MIN_INTERVAL apart to
+    catch immediate failures (e.g., InvalidConfiguration); after that the
+    interval doubles up to poll_interval, with up to 10% jitter.
     
-    while elapsed < timeout:
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        cert_name: Name of the Certificate resource
+        namespace: Namespace of the Certificate
+        start_time: time.time() when waiting started
+        deadline: time.time() by which to give up
+        poll_interval: Maximum time between checks in seconds
+    
+    Returns:
+        tuple | None: (success, status) once Ready or failed, None on timeout
+    """
+    interval = CERT_POLL_MIN_INTERVAL
+    attempt = 0
+    
+    while time.time() < deadline:
+        elapsed = time.time() - start_time
         try:
             cert = custom_api.get_namespaced_custom_object(
                 group="cert-manager.io",
@@ -1016,69 +1790,9 @@ def wait_for_certificate_ready(custom_api, cert_name, namespace, timeout=600, po
                 name=cert_name
             )
             
-            conditions = cert.get('status', {}).get('conditions', [])
-            
-            # Build a map of conditions for easier lookup
-            condition_map = {c.get('type'): c for c in conditions}
-            
-            # Check if certificate is Ready (success case)
-            ready_condition = condition_map.get('Ready')
-            if ready_condition and ready_condition.get('status') == 'True':
-                logger.info(f"      ✓ Certificate Ready (took {int(elapsed)}s)")
-                return True, cert.get('status', {})
-            
-            # Check Issuing condition for terminal failures
-            # When Issuing is False with reason "Failed", cert-manager has given up
-            issuing_condition = condition_map.get('Issuing')
-            if issuing_condition:
-                issuing_status = issuing_condition.get('status')
-                issuing_reason = issuing_condition.get('reason', '')
-                issuing_message = issuing_condition.get('message', 'No details')
-                
-                # Issuing condition with status False and reason Failed = terminal failure
-                if issuing_status == 'False' and issuing_reason in ['Failed', 'InvalidConfiguration', 'Denied']:
-                    detailed_error = _get_certificate_detailed_error(
-                        custom_api,
-                        cert_name,
-                        namespace,
-                        f"Issuing {issuing_reason}: {issuing_message}"
-                    )
-                    
-                    # Always log detailed errors on failure
-                    logger.info(f"      ✗ Certificate FAILED (Issuing condition): {issuing_reason}")
-                    logger.info(f"      📋 Details: {detailed_error}")
-                    
-                    status_with_error = cert.get('status', {})
-                    status_with_error['detailed_error'] = detailed_error
-                    return False, status_with_error
-            
-            # Check Ready condition for other terminal failures
-            # (e.g., configuration issues that prevent issuance from starting)
-            if ready_condition:
-                ready_reason = ready_condition.get('reason', 'Unknown')
-                ready_message = ready_condition.get('message', 'No details')
-                
-                # Some reasons in Ready condition also indicate terminal failures
-                if ready_reason in ['InvalidConfiguration', 'Denied']:
-                    detailed_error = _get_certificate_detailed_error(
-                        custom_api,
-                        cert_name,
-                        namespace,
-                        f"Ready {ready_reason}: {ready_message}"
-                    )
-                    
-                    logger.info(f"      ✗ Certificate FAILED (Ready condition): {ready_reason}")
-                    logger.info(f"      📋 Details: {detailed_error}")
-                    
-                    status_with_error = cert.get('status', {})
-                    status_with_error['detailed_error'] = detailed_error
-                    return False, status_with_error
-                
-                # Not a terminal failure, log progress
-                logger.info(f"      ⏳ Status: {ready_reason} - {ready_message}")
-            
-            if not any(c.get('type') == 'Ready' for c in conditions):
-                logger.info(f"      ⏳ Waiting for Ready condition... ({int(elapsed)}s elapsed)")
+            result = _check_certificate_status(custom_api, cert, cert_name, namespace, elapsed)
+            if result is not None:
+                return result
             
         except ApiException as e:
             if e.status == 404:
@@ -1086,8 +1800,45 @@ def wait_for_certificate_ready(custom_api, cert_name, namespace, timeout=600, po
             else:
                 logger.info(f"      ⚠ API error: {e}")
         
-        time.sleep(poll_interval)
-        elapsed = time.time() - start_time
+        attempt += 1
+        if attempt > CERT_POLL_FAST_ATTEMPTS:
+            interval = min(poll_interval, max(CERT_POLL_MIN_INTERVAL, interval * 2))
+        
+        delay = interval + random.uniform(0, interval * 0.1)
+        time.sleep(max(0, min(delay, deadline - time.time())))
+    
+    return None
+
+
+def wait_for_certificate_ready(custom_api, cert_name, namespace, timeout=600, poll_interval=CERT_POLL_MAX_INTERVAL):
+    """
+    Wait for a cert-manager Certificate to reach Ready status.
+    
+    Watches the Certificate so condition changes are seen as they happen,
+    falling back to polling with exponential backoff (capped at
+    poll_interval seconds) if the watch cannot be established.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        cert_name: Name of the Certificate resource
+        namespace: Namespace of the Certificate
+        timeout: Maximum time to wait in seconds (default: 600)
+        poll_interval: Maximum time between checks in seconds when polling (default: 30)
+    
+    Returns:
+        tuple: (success: bool, status: dict)
+    """
+    start_time = time.time()
+    deadline = start_time + timeout
+    
+    try:
+        result = _watch_certificate(custom_api, cert_name, namespace, start_time, deadline)
+    except ApiException as e:
+        logger.info(f"      ⚠ Certificate watch failed ({e.status}), falling back to polling")
+        result = _poll_certificate(custom_api, cert_name, namespace, start_time, deadline, poll_interval)
+    
+    if result is not None:
+        return result
     
     # Timeout reached - try to get detailed error
     detailed_error = f"Certificate not ready after {timeout}s"
@@ -1119,21 +1870,37 @@ def wait_for_certificate_ready(custom_api, cert_name, namespace, timeout=600, po
     return False, {'detailed_error': detailed_error}
 
 
-def validate_certificate_secret(core_v1, secret_name, namespace, expected_hostname=None):
+@functools.lru_cache(maxsize=256)
+def _parse_pem_certificate(pem_bytes):
     """
-    Validate TLS secret contains valid certificate.
+    Parse a PEM certificate, caching the result by PEM content.
+    
+    Certificate objects are immutable, so repeat validations of the same
+    secret reuse the parsed certificate instead of re-running ASN.1 parsing.
+    
+    Args:
+        pem_bytes: PEM-encoded certificate bytes
+    
+    Returns:
+        x509.Certificate: Parsed certificate
+    """
+    return x509.load_pem_x509_certificate(pem_bytes, default_backend())
+
+
+def _check_certificate_secret(core_v1, secret_name, namespace, expected_hostname, now):
+    """
+    Read a TLS secret and validate its certificate without logging.
     
     Args:
         core_v1: Kubernetes CoreV1Api client
         secret_name: Name of the TLS secret
         namespace: Namespace of the secret
-        expected_hostname: Expected hostname in certificate SAN (optional)
+        expected_hostname: Expected hostname in certificate SAN (or None)
+        now: Timezone-aware datetime to check validity against
     
     Returns:
         tuple: (problems, cert_info_dict)
     """
-    import base64
-    
     problems = []
     cert_info = {}
     
@@ -1146,25 +1913,23 @@ def validate_certificate_secret(core_v1, secret_name, namespace, expected_hostna
         
         # Decode and parse certificate
         cert_pem = base64.b64decode(secret.data['tls.crt'])
-        cert = x509.load_pem_x509_certificate(cert_pem, default_backend())
+        cert = _parse_pem_certificate(cert_pem)
         
         # Extract certificate info
-        subject = cert.subject
-        issuer = cert.issuer
         not_before = cert.not_valid_before_utc
         not_after = cert.not_valid_after_utc
         
         # Get common name
-        cn_attr = subject.get_attributes_for_oid(x509.oid.NameOID.COMMON_NAME)
+        cn_attr = cert.subject.get_attributes_for_oid(_CN_OID)
         common_name = cn_attr[0].value if cn_attr else "N/A"
         
         # Get issuer organization
-        issuer_org = issuer.get_attributes_for_oid(x509.oid.NameOID.ORGANIZATION_NAME)
+        issuer_org = cert.issuer.get_attributes_for_oid(_ORG_OID)
         issuer_name = issuer_org[0].value if issuer_org else "Unknown"
         
         # Get SANs
         try:
-            san_ext = cert.extensions.get_extension_for_oid(x509.oid.ExtensionOID.SUBJECT_ALTERNATIVE_NAME)
+            san_ext = cert.extensions.get_extension_for_oid(_SAN_OID)
             san_names = [name.value for name in san_ext.value]
         except x509.ExtensionNotFound:
             san_names = []
@@ -1178,7 +1943,6 @@ def validate_certificate_secret(core_v1, secret_name, namespace, expected_hostna
         }
         
         # Validate certificate is not expired
-        now = datetime.now(timezone.utc)
         if now < not_before:
             problems.append(f"Certificate not yet valid (starts {not_before})")
         elif now > not_after:
@@ -1189,19 +1953,83 @@ def validate_certificate_secret(core_v1, secret_name, namespace, expected_hostna
             if expected_hostname not in san_names and expected_hostname != common_name:
                 problems.append(f"Hostname '{expected_hostname}' not in certificate (CN: {common_name}, SANs: {san_names})")
         
-        if not problems:
-            logger.info(f"      CN: {common_name}")
-            logger.info(f"      Issuer: {issuer_name}")
-            logger.info(f"      Valid: {not_before} to {not_after}")
-            if san_names:
-                logger.info(f"      SANs: {', '.join(san_names)}")
-        
     except Exception as e:
         problems.append(f"Failed to validate secret {namespace}/{secret_name}: {e}")
     
     return problems, cert_info
 
 
+def log_certificate_info(cert_info):
+    """
+    Log the CN, issuer, validity window and SANs of a validated certificate.
+    
+    Args:
+        cert_info: cert_info dict returned by validate_certificate_secret(s)
+    """
+    logger.info(f"      CN: {cert_info['common_name']}")
+    logger.info(f"      Issuer: {cert_info['issuer']}")
+    logger.info(f"      Valid: {cert_info['not_before']} to {cert_info['not_after']}")
+    if cert_info['sans']:
+        logger.info(f"      SANs: {', '.join(cert_info['sans'])}")
+
+
+def validate_certificate_secret(core_v1, secret_name, namespace, expected_hostname=None):
+    """
+    Validate TLS secret contains valid certificate.
+    
+    Args:
+        core_v1: Kubernetes CoreV1Api client
+        secret_name: Name of the TLS secret
+        namespace: Namespace of the secret
+        expected_hostname: Expected hostname in certificate SAN (optional)
+    
+    Returns:
+        tuple: (problems, cert_info_dict)
+    """
+    problems, cert_info = _check_certificate_secret(
+        core_v1, secret_name, namespace, expected_hostname, datetime.now(timezone.utc)
+    )
+    
+    if not problems:
+        log_certificate_info(cert_info)
+    
+    return problems, cert_info
+
+
+def validate_certificate_secrets(core_v1, secrets):
+    """
+    Validate several TLS secrets, reading them in parallel.
+    
+    The validity window of every certificate is checked against a single
+    timestamp taken before the reads. Nothing is logged, so callers can
+    report results in order once all reads finish.
+    
+    Args:
+        core_v1: Kubernetes CoreV1Api client
+        secrets: List of (secret_name, namespace, expected_hostname) tuples;
+            expected_hostname may be None
+    
+    Returns:
+        list: (problems, cert_info_dict) tuples in the same order as secrets
+    """
+    if not secrets:
+        return []
+    
+    now = datetime.now(timezone.utc)
+    
+    with ThreadPoolExecutor(max_workers=min(CERT_SECRET_WORKERS, len(secrets))) as executor:
+        return list(executor.map(
+            lambda item: _check_certificate_secret(core_v1, item[0], item[1], item[2], now),
+            secrets
+        ))
+
+
+# Shared client TLS context (CA store loaded once). Sessions are never
+# resumed: a resumed session reports the certificate from the original
+# handshake, not the one the server is serving now.
+_TLS_CONTEXT = ssl.create_default_context()
+
+
 def validate_https_certificate(url, expected_hostname=None, max_retries=3, retry_delay=60):
     """
     Validate HTTPS certificate via SSL connection.
@@ -1226,10 +2054,8 @@ def validate_https_certificate(url, expected_hostname=None, max_retries=3, retry
             hostname = parsed.hostname
             port = parsed.port or 443
             
-            context = ssl.create_default_context()
-            
             with socket.create_connection((hostname, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                with _TLS_CONTEXT.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert_der = ssock.getpeercert(binary_form=True)
                     cert = x509.load_der_x509_certificate(cert_der, default_backend())
                     
@@ -1286,6 +2112,83 @@ def validate_https_certificate(url, expected_hostname=None, max_retries=3, retry
 # HTTP ENDPOINT VALIDATION
 # =============================================================================
 
+# Shared keep-alive pool for the HTTP validators. Adapter-level retries
+# are disabled so each validator's own retry loop owns the policy.
+_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(total=0, raise_on_status=False),
+)
+_SESSION.mount('https://', _HTTP_ADAPTER)
+_SESSION.mount('http://', _HTTP_ADAPTER)
+
+
+def close_http_session():
+    """
+    Close the pooled connections used by the HTTP validators.
+    
+    Safe to call more than once; the session reconnects on next use.
+    """
+    _SESSION.close()
+
+
+def _backoff(attempt, base=1.0, cap=60.0, jitter=0.5):
+    """
+    Truncated exponential backoff with jitter.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base: Delay after the first failure in seconds (default: 1.0)
+        cap: Maximum delay before jitter in seconds (default: 60.0)
+        jitter: Maximum extra fraction added at random (default: 0.5)
+    
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return min(cap, base * (2 ** attempt)) * (1 + random.random() * jitter)
+
+
+def _retry_delay(attempt, retry_delays=None):
+    """
+    Seconds to wait after a failed attempt.
+    
+    Uses the caller's explicit schedule when given (repeating its last
+    value once exhausted), otherwise _backoff().
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_delays: Optional list of delays in seconds
+    
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    if retry_delays:
+        return retry_delays[min(attempt, len(retry_delays) - 1)]
+    return _backoff(attempt)
+
+
+# Non-200 statuses worth retrying. 404 is included because ingress
+# controllers answer 404 until a newly synced route is programmed;
+# other 4xx (401, 403, ...) won't change by waiting.
+_RETRYABLE_STATUS = frozenset({404, 408, 425, 429, 500, 502, 503, 504})
+
+# Parse JSON bodies from bytes with orjson when installed; both raise a
+# ValueError subclass on invalid input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Stand-in for a missing 'headers' object in the echo response
+_EMPTY = {}
+
+
+class _RetryableError(Exception):
+    """An HTTP validation attempt failed; args are the problem messages."""
+
+
+class _UnrecoverableError(Exception):
+    """An HTTP validation failed in a way retrying won't fix."""
+
+
 def validate_http_debug_app(url, expected_hostname, app_name=None, max_retries=3, retry_delays=None):
     """
     Validate mendhak/http-https-echo application response.
@@ -1295,100 +2198,110 @@ def validate_http_debug_app(url, expected_hostname, app_name=None, max_retries=3
         expected_hostname: Expected hostname in response
         app_name: App name for error messages (defaults to hostname)
         max_retries: Number of retry attempts (default: 3)
-        retry_delays: List of delay seconds between retries
+        retry_delays: Optional list of delay seconds between retries
+            (default: exponential backoff with jitter)
     
     Returns:
         tuple: (problems, response_data)
     """
     problems = []
     response_data = {}
-    retry_delays = retry_delays or [10, 30, 60]
     app_name = app_name or expected_hostname
+    log_info = logger.isEnabledFor(logging.INFO)
+    delay = 0
     
     for attempt in range(max_retries):
+        if attempt > 0:
+            logger.info("      [%s] Retry %s/%s after %.0fs...", app_name, attempt, max_retries - 1, delay)
+        
         try:
-            if attempt > 0:
-                logger.info(f"      Retry {attempt}/{max_retries - 1} after {retry_delays[attempt - 1]}s...")
-            
-            response = requests.get(url, timeout=30, verify=True)
+            # Body is read once as bytes and parsed by _json_loads; no text decoding
+            response = _SESSION.get(url, timeout=30, verify=True, stream=False)
             
             if response.status_code != 200:
-                error_msg = f"HTTP {response.status_code}"
-                if attempt == max_retries - 1:
-                    problems.append(f"{app_name} - {error_msg}")
-                    logger.info(f"      ✗ {error_msg}")
-                else:
-                    logger.info(f"      ✗ {error_msg}, retrying in {retry_delays[attempt]}s...")
-                    time.sleep(retry_delays[attempt])
-                    continue
+                if response.status_code not in _RETRYABLE_STATUS:
+                    raise _UnrecoverableError(f"HTTP {response.status_code}")
+                raise _RetryableError(f"HTTP {response.status_code}")
             
             try:
-                json_data = response.json()
-                response_data = json_data
+                json_data = _json_loads(response.content)
             except ValueError:
-                error_msg = "Response is not valid JSON"
-                if attempt == max_retries - 1:
-                    problems.append(f"{app_name} - {error_msg}")
-                    logger.info(f"      ✗ {error_msg}")
-                else:
-                    logger.info(f"      ✗ {error_msg}, retrying in {retry_delays[attempt]}s...")
-                    time.sleep(retry_delays[attempt])
-                    continue
+                raise _RetryableError("Response is not valid JSON")
+            response_data = json_data
             
             # Validate expected fields
-            validations = {
-                'hostname': (None, 'hostname', expected_hostname),
-                'x-scheme': ('headers', 'x-forwarded-port', '443'),
-                'x-forwarded-proto': ('headers', 'x-forwarded-proto', 'https')
-            }
+            headers = json_data.get('headers') or _EMPTY
+            checks = (
+                ("hostname", json_data.get('hostname'), expected_hostname),
+                ("headers.x-forwarded-port", headers.get('x-forwarded-port'), "443"),
+                ("headers.x-forwarded-proto", headers.get('x-forwarded-proto'), "https"),
+            )
             
             field_errors = []
-            for field_name, (parent_key, json_key, expected_value) in validations.items():
-                if parent_key:
-                    actual_value = json_data.get(parent_key, {}).get(json_key)
-                    display_key = f"{parent_key}.{json_key}"
-                else:
-                    actual_value = json_data.get(json_key)
-                    display_key = json_key
-                
+            for display_key, actual_value, expected_value in checks:
                 if actual_value == expected_value:
-                    logger.info(f"      ✓ {display_key}: {actual_value}")
+                    if log_info:
+                        logger.info("      [%s] ✓ %s: %s", app_name, display_key, actual_value)
                 else:
-                    error_msg = f"{display_key}: expected '{expected_value}', got '{actual_value}'"
-                    logger.info(f"      ✗ {error_msg}")
-                    field_errors.append(f"{app_name} - {error_msg}")
+                    field_errors.append(f"{display_key}: expected '{expected_value}', got '{actual_value}'")
             
             if field_errors:
-                if attempt == max_retries - 1:
-                    problems.extend(field_errors)
-                else:
-                    logger.info(f"      Validation failed, retrying in {retry_delays[attempt]}s...")
-                    time.sleep(retry_delays[attempt])
-                    continue
+                raise _RetryableError(*field_errors)
             
             # Success
             break
             
+        except _UnrecoverableError as e:
+            logger.info("      [%s] ✗ %s (not retryable)", app_name, e)
+            problems.append(f"{app_name} - {e}")
+            break
+        except _RetryableError as e:
+            errors = list(e.args)
         except requests.exceptions.SSLError as e:
-            error_msg = f"SSL error: {e}"
-            if attempt == max_retries - 1:
-                problems.append(f"{app_name} - {error_msg}")
-                logger.info(f"      ✗ {error_msg}")
-            else:
-                logger.info(f"      ✗ {error_msg}, retrying in {retry_delays[attempt]}s...")
-                time.sleep(retry_delays[attempt])
+            errors = [f"SSL error: {e}"]
         except Exception as e:
-            error_msg = f"Request failed: {e}"
-            if attempt == max_retries - 1:
-                problems.append(f"{app_name} - {error_msg}")
-                logger.info(f"      ✗ {error_msg}")
-            else:
-                logger.info(f"      ✗ {error_msg}, retrying in {retry_delays[attempt]}s...")
-                time.sleep(retry_delays[attempt])
+            errors = [f"Request failed: {e}"]
+        
+        if log_info:
+            for error_msg in errors:
+                logger.info("      [%s] ✗ %s", app_name, error_msg)
+        
+        if attempt == max_retries - 1:
+            problems.extend(f"{app_name} - {error_msg}" for error_msg in errors)
+        else:
+            delay = _retry_delay(attempt, retry_delays)
+            logger.info("      [%s] Validation failed, retrying in %.0fs...", app_name, delay)
+            time.sleep(delay)
     
     return problems, response_data
 
 
+def validate_http_debug_apps(items, workers=HTTP_VALIDATION_WORKERS, **kwargs):
+    """
+    Run validate_http_debug_app for several apps concurrently.
+    
+    Each validation is independent network I/O, so they run on a thread
+    pool sharing the pooled HTTP session. Log lines from different apps
+    may interleave, so each one is prefixed with its app name.
+    
+    Args:
+        items: List of (url, expected_hostname, app_name) tuples
+        workers: Maximum concurrent validations (default: HTTP_VALIDATION_WORKERS)
+        **kwargs: Passed to validate_http_debug_app (max_retries, retry_delays)
+    
+    Returns:
+        tuple: (problems, response_data_list) with responses in item order
+    """
+    if not items:
+        return [], []
+    
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        results = list(executor.map(lambda item: validate_http_debug_app(*item, **kwargs), items))
+    
+    problems = [problem for item_problems, _ in results for problem in item_problems]
+    return problems, [response_data for _, response_data in results]
+
+
 def validate_whoami_env_vars(url, expected_env_vars, app_name="app", max_retries=3, retry_delays=None):
     """
     Validate environment variables in traefik/whoami application response.
@@ -1398,59 +2311,61 @@ def validate_whoami_env_vars(url, expected_env_vars, app_name="app", max_retries
         expected_env_vars: Dict of env var names to expected values
         app_name: Application name for logging
         max_retries: Maximum number of retry attempts
-        retry_delays: List of delays between retries
+        retry_delays: Optional list of delays between retries
+            (default: exponential backoff with jitter)
     
     Returns:
         tuple: (problems_list, env_vars_dict)
     """
-    if retry_delays is None:
-        retry_delays = [10, 30, 60]
-    
     problems = []
     
-    while len(retry_delays) < max_retries - 1:
-        retry_delays.append(retry_delays[-1] if retry_delays else 30)
-    
     for attempt in range(1, max_retries + 1):
         try:
             if attempt > 1:
-                logger.info(f"      Retry {attempt}/{max_retries}...")
+                logger.info("      [%s] Retry %s/%s...", app_name, attempt, max_retries)
             
             request_url = f"{url}?env=true"
-            logger.info(f"      GET {request_url}")
-            
-            response = requests.get(request_url, timeout=30, verify=True)
+            logger.info("      [%s] GET %s", app_name, request_url)
             
-            logger.info(f"      Status: {response.status_code}")
+            response = _SESSION.get(request_url, timeout=30, verify=True, stream=True)
             
-            if response.status_code != 200:
-                if attempt < max_retries:
-                    delay = retry_delays[attempt - 1]
-                    logger.info(f"      ⏳ Waiting {delay}s before retry...")
-                    time.sleep(delay)
-                    continue
-                else:
-                    problems.append(f"{app_name}: HTTP {response.status_code}")
-                    return problems, {}
-            
-            text = response.text
-            logger.info(f"      ✓ Response received, parsing environment variables...")
-            
-            lines = text.split('\n')
-            env_vars = {}
-            
-            found_env_section = False
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    found_env_section = True
-                    continue
+            try:
+                logger.info("      [%s] Status: %s", app_name, response.status_code)
+                
+                if response.status_code != 200:
+                    response.close()
+                    if attempt < max_retries and response.status_code in _RETRYABLE_STATUS:
+                        delay = _retry_delay(attempt - 1, retry_delays)
+                        logger.info("      [%s] ⏳ Waiting %.0fs before retry...", app_name, delay)
+                        time.sleep(delay)
+                        continue
+                    else:
+                        problems.append(f"{app_name}: HTTP {response.status_code}")
+                        return problems, {}
+                
+                logger.info("      [%s] ✓ Response received, parsing environment variables...", app_name)
+                
+                # Stream the body line by line instead of decoding and splitting it whole.
+                # whoami always writes UTF-8; pinning it skips charset detection and
+                # the ISO-8859-1 default requests applies to text/* without a charset.
+                response.encoding = 'utf-8'
+                env_vars = {}
                 
-                if found_env_section and '=' in line:
-                    key, _, value = line.partition('=')
-                    env_vars[key] = value
+                found_env_section = False
+                for line in response.iter_lines(chunk_size=8192, decode_unicode=True):
+                    line = line.strip()
+                    if not line:
+                        found_env_section = True
+                        continue
+                    
+                    if found_env_section:
+                        key, sep, value = line.partition('=')
+                        if sep:
+                            env_vars[key] = value
+            finally:
+                response.close()
             
-            logger.info(f"      ✓ Found {len(env_vars)} environment variables")
+            logger.info("      [%s] ✓ Found %s environment variables", app_name, len(env_vars))
             
             missing_vars = []
             wrong_values = []
@@ -1468,15 +2383,15 @@ def validate_whoami_env_vars(url, expected_env_vars, app_name="app", max_retries
                 problems.append(f"{app_name}: Wrong values: {', '.join(wrong_values)}")
             
             if not problems:
-                logger.info(f"      ✓ All {len(expected_env_vars)} expected env vars validated")
+                logger.info("      [%s] ✓ All %s expected env vars validated", app_name, len(expected_env_vars))
             
             return problems, env_vars
         
         except requests.exceptions.RequestException as e:
             if attempt < max_retries:
-                delay = retry_delays[attempt - 1]
-                logger.info(f"      ⚠ Request failed: {str(e)}")
-                logger.info(f"      ⏳ Waiting {delay}s before retry...")
+                delay = _retry_delay(attempt - 1, retry_delays)
+                logger.info("      [%s] ⚠ Request failed: %s", app_name, e)
+                logger.info("      [%s] ⏳ Waiting %.0fs before retry...", app_name, delay)
                 time.sleep(delay)
             else:
                 problems.append(f"{app_name}: Request failed after {max_retries} retries - {str(e)}")
@@ -1484,3 +2399,25 @@ def validate_whoami_env_vars(url, expected_env_vars, app_name="app", max_retries
     
     problems.append(f"{app_name}: Failed to validate after {max_retries} attempts")
     return problems, {}
+
+
+def validate_whoami_env_vars_many(items, workers=HTTP_VALIDATION_WORKERS, **kwargs):
+    """
+    Run validate_whoami_env_vars for several apps concurrently.
+    
+    Args:
+        items: List of (url, expected_env_vars, app_name) tuples
+        workers: Maximum concurrent validations (default: HTTP_VALIDATION_WORKERS)
+        **kwargs: Passed to validate_whoami_env_vars (max_retries, retry_delays)
+    
+    Returns:
+        tuple: (problems, env_vars_list) with env vars in item order
+    """
+    if not items:
+        return [], []
+    
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        results = list(executor.map(lambda item: validate_whoami_env_vars(*item, **kwargs), items))
+    
+    problems = [problem for item_problems, _ in results for problem in item_problems]
+    return problems, [env_vars for _, env_vars in results]
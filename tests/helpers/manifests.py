@@ -4,70 +4,69 @@ Manifest generation helpers for dynamic ArgoCD resources.
 This module provides functions to generate Kubernetes and ArgoCD manifests
 dynamically for test environments based on captain domain and tenant configuration.
 """
+import sys
+import string
 import logging
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
+# project-template chart version deployed by the generated ApplicationSets
+PROJECT_TEMPLATE_CHART_VERSION = "0.9.0-rc5"
 
-def extract_namespace_from_captain_domain(captain_domain: str) -> str:
-    """
-    Extract the namespace/environment name from a captain domain.
-    
-    The namespace is the first part of the captain domain before the first dot.
-    For example:
-    - 'nonprod.jupiter.onglueops.rocks' -> 'nonprod'
-    - 'staging.saturn.onglueops.com' -> 'staging'
-    - 'prod.mars.onglueops.io' -> 'prod'
-    
-    Args:
-        captain_domain: The full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
-        
-    Returns:
-        str: The namespace/environment name (e.g., 'nonprod')
-    """
-    return captain_domain.split('.')[0]
 
+# =============================================================================
+# MANIFEST TEMPLATES
+# =============================================================================
+# Placeholders are <<name>>, so ArgoCD's Go template {{ }} expressions are
+# written as-is with no brace escaping.
 
-def generate_namespace_yaml(namespace_name: str) -> str:
-    """
-    Generate a Kubernetes Namespace manifest YAML.
+
+class _ManifestTemplate(string.Template):
+    """string.Template using <<name>> placeholders (<<<< for a literal <<)."""
     
-    Args:
-        namespace_name: Name of the namespace (e.g., 'nonprod')
-        
-    Returns:
-        str: YAML string for the Namespace resource
+    delimiter = '<<'
+    pattern = r"""
+    <<(?:
+        (?P<escaped><<) |
+        (?P<named>[_a-z][_a-z0-9]*)>> |
+        (?P<braced>(?!x)x) |
+        (?P<invalid>)
+    )
     """
-    return f"""apiVersion: v1
+
+
+_NAMESPACE_TMPL = _ManifestTemplate("""apiVersion: v1
 kind: Namespace
 metadata:
   labels:
-    kubernetes.io/metadata.name: {namespace_name}
-  name: {namespace_name}
-"""
+    kubernetes.io/metadata.name: <<namespace_name>>
+  name: <<namespace_name>>
+""")
 
 
-def generate_appproject_yaml(namespace_name: str, tenant_github_org: str) -> str:
-    """
-    Generate an ArgoCD AppProject manifest YAML.
-    
-    The AppProject defines RBAC, source repos, and destinations for a tenant environment.
-    Groups are hardcoded to use 'developers' role pattern.
-    
-    Args:
-        namespace_name: Name of the namespace/project (e.g., 'nonprod')
-        tenant_github_org: GitHub organization name for the tenant (e.g., 'development-tenant-jupiter')
-        
-    Returns:
-        str: YAML string for the AppProject resource
-    """
-    return f"""apiVersion: argoproj.io/v1alpha1
+# Actions granted to the AppProject's admins role, one policy line each
+_ADMIN_VERBS = (
+    "applications, get",
+    "applications, sync",
+    "logs, *",
+    "applications, action/external-secrets.io/ExternalSecret/refresh",
+    "exec, *",
+    "applications, action/apps/Deployment/restart",
+    "applications, delete/*/Pod/*/*",
+    "applications, delete/*/Deployment/*/*",
+    "applications, delete/*/ReplicaSet/*/*",
+    "applications, action/batch/CronJob/create-job",
+    "applications, action/batch/Job/terminate",
+)
+
+_APPPROJECT_TMPL = _ManifestTemplate("""apiVersion: argoproj.io/v1alpha1
 kind: AppProject   
 metadata:
-  name: {namespace_name}
+  name: <<namespace_name>>
 spec:      
   sourceNamespaces:
-  - '{namespace_name}'                  
+  - '<<namespace_name>>'                  
   clusterResourceBlacklist:
   - group: '*'
     kind: '*'   
@@ -78,36 +77,26 @@ spec:
     kind: 'CustomResourceDefinition'
   destinations:
   - name: '*'
-    namespace: '{namespace_name}'
+    namespace: '<<namespace_name>>'
     server: '*'
   - name: '*'
     namespace: 'glueops-core'
     server: '*'
   roles:
-  - description: {tenant_github_org}:developers
+  - description: <<tenant_github_org>>:developers
     groups:
-    - "{tenant_github_org}:developers"
+    - "<<tenant_github_org>>:developers"
     policies:
-    - p, proj:{namespace_name}:read-only, applications, get, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, applications, action/batch/CronJob/create-job, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, logs, *, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, applications, action/external-secrets.io/ExternalSecret/refresh, {namespace_name}/*, allow
+    - p, proj:<<namespace_name>>:read-only, applications, get, <<namespace_name>>/*, allow
+    - p, proj:<<namespace_name>>:read-only, applications, action/batch/CronJob/create-job, <<namespace_name>>/*, allow
+    - p, proj:<<namespace_name>>:read-only, logs, *, <<namespace_name>>/*, allow
+    - p, proj:<<namespace_name>>:read-only, applications, action/external-secrets.io/ExternalSecret/refresh, <<namespace_name>>/*, allow
     name: read-only
-  - description: {tenant_github_org}:developers
+  - description: <<tenant_github_org>>:developers
     groups:
-    - "{tenant_github_org}:developers"
+    - "<<tenant_github_org>>:developers"
     policies:
-    - p, proj:{namespace_name}:read-only, applications, get, {namespace_name}/*, allow   
-    - p, proj:{namespace_name}:read-only, applications, sync, {namespace_name}/*, allow   
-    - p, proj:{namespace_name}:read-only, logs, *, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, applications, action/external-secrets.io/ExternalSecret/refresh, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, exec, *, {namespace_name}/*, allow   
-    - p, proj:{namespace_name}:read-only, applications, action/apps/Deployment/restart, {namespace_name}/*, allow   
-    - p, proj:{namespace_name}:read-only, applications, delete/*/Pod/*/*, {namespace_name}/*, allow   
-    - p, proj:{namespace_name}:read-only, applications, delete/*/Deployment/*/*, {namespace_name}/*, allow 
-    - p, proj:{namespace_name}:read-only, applications, delete/*/ReplicaSet/*/*, {namespace_name}/*, allow 
-    - p, proj:{namespace_name}:read-only, applications, action/batch/CronJob/create-job, {namespace_name}/*, allow
-    - p, proj:{namespace_name}:read-only, applications, action/batch/Job/terminate, {namespace_name}/*, allow
+    <<admin_policies>>
     name: admins
   sourceRepos:
   - https://helm.gpkg.io/project-template
@@ -115,43 +104,20 @@ spec:
   - https://incubating-helm.gpkg.io/project-template
   - https://incubating-helm.gpkg.io/service
   - https://incubating-helm.gpkg.io/platform
-  - https://github.com/{tenant_github_org}/*
-"""
+  - https://github.com/<<tenant_github_org>>/*
+""")
 
 
-def generate_appset_yaml(
-    namespace_name: str,
-    tenant_github_org: str,
-    deployment_config_repo: str,
-    captain_domain: str
-) -> str:
-    """
-    Generate an ArgoCD ApplicationSet manifest YAML.
-    
-    The ApplicationSet auto-discovers and deploys applications from the
-    deployment-configurations repository based on directory structure.
-    
-    Args:
-        namespace_name: Name of the namespace/environment (e.g., 'nonprod')
-        tenant_github_org: GitHub organization name (e.g., 'development-tenant-jupiter')
-        deployment_config_repo: Name of the deployment configurations repo (e.g., 'deployment-configurations')
-        captain_domain: Full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
-        
-    Returns:
-        str: YAML string for the ApplicationSet resource
-    """
-    repo_url = f"https://github.com/{tenant_github_org}/{deployment_config_repo}"
-    
-    return f"""apiVersion: argoproj.io/v1alpha1
+_APPSET_TMPL = _ManifestTemplate("""apiVersion: argoproj.io/v1alpha1
 kind: ApplicationSet
 metadata:
-  name: {namespace_name}-application-set
+  name: <<namespace_name>>-application-set
   namespace: glueops-core
 spec:
   goTemplate: true
   generators:
   - git:
-      repoURL: {repo_url}
+      repoURL: <<repo_url>>
       revision: main
       directories:
       - path: 'apps/*/envs/*'
@@ -162,31 +128,31 @@ spec:
 
   template:
     metadata:
-      name: '{{{{ index .path.segments 1 | replace "." "-"  | replace "_" "-" }}}}-{{{{ .path.basenameNormalized }}}}'
-      namespace: {namespace_name}
+      name: '{{ index .path.segments 1 | replace "." "-"  | replace "_" "-" }}-{{ .path.basenameNormalized }}'
+      namespace: <<namespace_name>>
       annotations:
         preview_environment: 'false'
     spec:
       destination:
-        namespace: {namespace_name}
+        namespace: <<namespace_name>>
         server: https://kubernetes.default.svc
-      project: {namespace_name}
+      project: <<namespace_name>>
       sources:
       - chart: app
         helm:
           ignoreMissingValueFiles: true
           valueFiles:
           - '$values/common/common-values.yaml'
-          - '$values/env-overlays/{namespace_name}/env-values.yaml'
-          - '$values/apps/{{{{ index .path.segments 1 }}}}/base/base-values.yaml'
-          - '$values/{{{{ .path.path }}}}/values.yaml'
+          - '$values/env-overlays/<<namespace_name>>/env-values.yaml'
+          - '$values/apps/{{ index .path.segments 1 }}/base/base-values.yaml'
+          - '$values/{{ .path.path }}/values.yaml'
           values: |-
-            captain_domain: {captain_domain}
-            glueops_app_name: '{{{{ index .path.segments 1 | replace "." "-"  | replace "_" "-" }}}}-{{{{ .path.basenameNormalized }}}}'
+            captain_domain: <<captain_domain>>
+            glueops_app_name: '{{ index .path.segments 1 | replace "." "-"  | replace "_" "-" }}-{{ .path.basenameNormalized }}'
 
         repoURL: https://helm.gpkg.io/project-template
-        targetRevision: 0.9.0-rc5
-      - repoURL: {repo_url}
+        targetRevision: <<chart_version>>
+      - repoURL: <<repo_url>>
         targetRevision: main
         ref: values
       syncPolicy:
@@ -201,35 +167,10 @@ spec:
           limit: 2
         syncOptions:
         - CreateNamespace=true
-"""
+""")
 
 
-def generate_pullrequest_appset_yaml(
-    namespace_name: str,
-    tenant_github_org: str,
-    deployment_config_repo: str,
-    captain_domain: str
-) -> str:
-    """
-    Generate an ArgoCD ApplicationSet manifest YAML for pull request preview environments.
-    
-    The ApplicationSet auto-discovers pull requests from repositories in the tenant's
-    GitHub organization and creates preview environments for each PR.
-    
-    Uses a matrix generator combining:
-    - scmProvider: Discovers all repositories in the organization
-    - pullRequest: Monitors pull requests in each discovered repository
-    
-    Args:
-        namespace_name: Name of the namespace/environment (e.g., 'nonprod')
-        tenant_github_org: GitHub organization name (e.g., 'development-tenant-jupiter')
-        deployment_config_repo: Name of the deployment configurations repo (e.g., 'deployment-configurations')
-        captain_domain: Full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
-        
-    Returns:
-        str: YAML string for the pull request ApplicationSet resource
-    """
-    return f"""apiVersion: argoproj.io/v1alpha1
+_PULLREQUEST_APPSET_TMPL = _ManifestTemplate("""apiVersion: argoproj.io/v1alpha1
 kind: ApplicationSet
 metadata:
   name: pull-request-preview-environments
@@ -243,7 +184,7 @@ spec:
           cloneProtocol: https
           github:
             allBranches: false
-            organization: {tenant_github_org}
+            organization: <<tenant_github_org>>
             appSecretName: tenant-repo-creds
           filters:
             - repositoryMatch: "[Dd][Ee][Mm][Oo].*"
@@ -251,29 +192,29 @@ spec:
             
       - pullRequest:
           github:
-            owner: {tenant_github_org}
+            owner: <<tenant_github_org>>
             appSecretName: tenant-repo-creds
-            repo: '{{{{ .repository }}}}'
+            repo: '{{ .repository }}'
           requeueAfterSeconds: 30
   template:
     metadata:
       name: >-
-        {{{{- $repo := .repository | replace "_" "-" | replace "." "-" | lower -}}}}
-        {{{{- if gt (len $repo) 41 -}}}}
-          {{{{- printf "%s-%s" ($repo | trunc 35 | trimSuffix "-") ($repo | sha1sum | trunc 5) -}}}}
-        {{{{- else -}}}}
-          {{{{- $repo -}}}}
-        {{{{- end -}}}}-pr-{{{{- .number -}}}}
-      namespace: {namespace_name}
+        {{- $repo := .repository | replace "_" "-" | replace "." "-" | lower -}}
+        {{- if gt (len $repo) 41 -}}
+          {{- printf "%s-%s" ($repo | trunc 35 | trimSuffix "-") ($repo | sha1sum | trunc 5) -}}
+        {{- else -}}
+          {{- $repo -}}
+        {{- end -}}-pr-{{- .number -}}
+      namespace: <<namespace_name>>
       annotations:
-        repository_organization: "{tenant_github_org}"
-        repository_name: '{{{{ .repository }}}}'
+        repository_organization: "<<tenant_github_org>>"
+        repository_name: '{{ .repository }}'
         preview_environment: 'true'
-        pull_request_number: '{{{{.number}}}}'
-        branch: '{{{{.branch}}}}'
-        branch_slug: '{{{{.branch_slug}}}}'
-        head_sha: '{{{{.head_sha}}}}'
-        head_short_sha: '{{{{.head_short_sha}}}}'
+        pull_request_number: '{{.number}}'
+        branch: '{{.branch}}'
+        branch_slug: '{{.branch_slug}}'
+        head_sha: '{{.head_sha}}'
+        head_short_sha: '{{.head_short_sha}}'
       finalizers:
       - resources-finalizer.argocd.argoproj.io
       labels:
@@ -286,21 +227,21 @@ spec:
             valueFiles:
             - '$configValues/common/common-values.yaml'
             - '$configValues/env-overlays/nonprod/env-values.yaml'
-            - '$configValues/apps/{{{{ .repository }}}}/base/base-values.yaml'
-            - '$configValues/apps/{{{{ .repository }}}}/envs/previews/common/values.yaml'
-            - '$configValues/apps/{{{{ .repository }}}}/envs/previews/pull-request-number/{{{{ .number }}}}/values.yaml'
+            - '$configValues/apps/{{ .repository }}/base/base-values.yaml'
+            - '$configValues/apps/{{ .repository }}/envs/previews/common/values.yaml'
+            - '$configValues/apps/{{ .repository }}/envs/previews/pull-request-number/{{ .number }}/values.yaml'
             values: |-
               image:
-                tag: '{{{{.head_sha}}}}'
+                tag: '{{.head_sha}}'
             
-              captain_domain: {captain_domain}
+              captain_domain: <<captain_domain>>
             
           repoURL: https://helm.gpkg.io/project-template
-          targetRevision: 0.9.0-rc5
-        - repoURL: https://github.com/{tenant_github_org}/{{{{ .repository }}}}
-          targetRevision: '{{{{ .head_sha }}}}'
+          targetRevision: <<chart_version>>
+        - repoURL: https://github.com/<<tenant_github_org>>/{{ .repository }}
+          targetRevision: '{{ .head_sha }}'
           ref: values
-        - repoURL: https://github.com/{tenant_github_org}/{deployment_config_repo}
+        - repoURL: https://github.com/<<tenant_github_org>>/<<deployment_config_repo>>
           targetRevision: main
           ref: configValues
       syncPolicy:
@@ -316,8 +257,164 @@ spec:
         syncOptions:
         - CreateNamespace=true
 
-      project: {namespace_name}
+      project: <<namespace_name>>
       destination:
         server: https://kubernetes.default.svc
-        namespace: {namespace_name}
-"""
+        namespace: <<namespace_name>>
+""")
+
+
+# =============================================================================
+# GENERATORS
+# =============================================================================
+
+
+def _intern_args(func):
+    """
+    Intern string arguments before they reach the wrapped lru_cache.
+    
+    The generator inputs are a handful of distinct names per run, so
+    interning makes cache keys share one str object per value and lets
+    key comparison short-circuit on identity.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        args = tuple(sys.intern(a) if type(a) is str else a for a in args)
+        kwargs = {k: sys.intern(v) if type(v) is str else v for k, v in kwargs.items()}
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def extract_namespace_from_captain_domain(captain_domain: str) -> str:
+    """
+    Extract the namespace/environment name from a captain domain.
+    
+    The namespace is the first part of the captain domain before the first dot.
+    For example:
+    - 'nonprod.jupiter.onglueops.rocks' -> 'nonprod'
+    - 'staging.saturn.onglueops.com' -> 'staging'
+    - 'prod.mars.onglueops.io' -> 'prod'
+    
+    Args:
+        captain_domain: The full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
+        
+    Returns:
+        str: The namespace/environment name (e.g., 'nonprod')
+    """
+    return captain_domain.split('.')[0]
+
+
+@_intern_args
+@lru_cache(maxsize=128)
+def generate_namespace_yaml(namespace_name: str) -> str:
+    """
+    Generate a Kubernetes Namespace manifest YAML.
+    
+    Args:
+        namespace_name: Name of the namespace (e.g., 'nonprod')
+        
+    Returns:
+        str: YAML string for the Namespace resource
+    """
+    return _NAMESPACE_TMPL.substitute({"namespace_name": namespace_name})
+
+
+@_intern_args
+@lru_cache(maxsize=128)
+def generate_appproject_yaml(namespace_name: str, tenant_github_org: str) -> str:
+    """
+    Generate an ArgoCD AppProject manifest YAML.
+    
+    The AppProject defines RBAC, source repos, and destinations for a tenant environment.
+    Groups are hardcoded to use 'developers' role pattern.
+    
+    Args:
+        namespace_name: Name of the namespace/project (e.g., 'nonprod')
+        tenant_github_org: GitHub organization name for the tenant (e.g., 'development-tenant-jupiter')
+        
+    Returns:
+        str: YAML string for the AppProject resource
+    """
+    admin_policies = "\n    ".join(
+        f"- p, proj:{namespace_name}:read-only, {verb}, {namespace_name}/*, allow"
+        for verb in _ADMIN_VERBS
+    )
+    
+    return _APPPROJECT_TMPL.substitute({
+        "namespace_name": namespace_name,
+        "tenant_github_org": tenant_github_org,
+        "admin_policies": admin_policies,
+    })
+
+
+@_intern_args
+@lru_cache(maxsize=128)
+def generate_appset_yaml(
+    namespace_name: str,
+    tenant_github_org: str,
+    deployment_config_repo: str,
+    captain_domain: str,
+    chart_version: str = PROJECT_TEMPLATE_CHART_VERSION
+) -> str:
+    """
+    Generate an ArgoCD ApplicationSet manifest YAML.
+    
+    The ApplicationSet auto-discovers and deploys applications from the
+    deployment-configurations repository based on directory structure.
+    
+    Args:
+        namespace_name: Name of the namespace/environment (e.g., 'nonprod')
+        tenant_github_org: GitHub organization name (e.g., 'development-tenant-jupiter')
+        deployment_config_repo: Name of the deployment configurations repo (e.g., 'deployment-configurations')
+        captain_domain: Full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
+        chart_version: project-template chart version (default: PROJECT_TEMPLATE_CHART_VERSION)
+        
+    Returns:
+        str: YAML string for the ApplicationSet resource
+    """
+    repo_url = f"https://github.com/{tenant_github_org}/{deployment_config_repo}"
+    
+    return _APPSET_TMPL.substitute({
+        "namespace_name": namespace_name,
+        "repo_url": repo_url,
+        "captain_domain": captain_domain,
+        "chart_version": chart_version,
+    })
+
+
+@_intern_args
+@lru_cache(maxsize=128)
+def generate_pullrequest_appset_yaml(
+    namespace_name: str,
+    tenant_github_org: str,
+    deployment_config_repo: str,
+    captain_domain: str,
+    chart_version: str = PROJECT_TEMPLATE_CHART_VERSION
+) -> str:
+    """
+    Generate an ArgoCD ApplicationSet manifest YAML for pull request preview environments.
+    
+    The ApplicationSet auto-discovers pull requests from repositories in the tenant's
+    GitHub organization and creates preview environments for each PR.
+    
+    Uses a matrix generator combining:
+    - scmProvider: Discovers all repositories in the organization
+    - pullRequest: Monitors pull requests in each discovered repository
+    
+    Args:
+        namespace_name: Name of the namespace/environment (e.g., 'nonprod')
+        tenant_github_org: GitHub organization name (e.g., 'development-tenant-jupiter')
+        deployment_config_repo: Name of the deployment configurations repo (e.g., 'deployment-configurations')
+        captain_domain: Full captain domain (e.g., 'nonprod.jupiter.onglueops.rocks')
+        chart_version: project-template chart version (default: PROJECT_TEMPLATE_CHART_VERSION)
+        
+    Returns:
+        str: YAML string for the pull request ApplicationSet resource
+    """
+    return _PULLREQUEST_APPSET_TMPL.substitute({
+        "namespace_name": namespace_name,
+        "tenant_github_org": tenant_github_org,
+        "deployment_config_repo": deployment_config_repo,
+        "captain_domain": captain_domain,
+        "chart_version": chart_version,
+    })
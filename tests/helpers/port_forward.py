@@ -1,17 +1,243 @@
 """
-Generic port-forwarding utility for kubectl.
+Generic port-forwarding utility for Kubernetes services.
 
-This module provides a context manager for establishing kubectl port-forward
-connections to Kubernetes services.
+This module provides a context manager for establishing port-forward
+connections to Kubernetes services. By default it spawns
+`kubectl port-forward`; set PORT_FORWARD_BACKEND=api to forward in-process
+over the API server's portforward websocket (kubernetes.stream.portforward).
+
+PortForward(..., reuse=True) pools forwards by (namespace, service, port,
+local_port): entering one whose target already has a live pooled
+forwarder reuses it instead of starting a new one. Pooled forwarders stay
+up until PortForward.close_all() (called at session end and at
+interpreter exit). Without reuse, each PortForward owns its forwarder and
+stops it on exit.
 """
+import os
+import atexit
+import logging
+import select
+import socket
 import subprocess
+import threading
 import time
 
+from kubernetes import client, config
+from kubernetes.stream import portforward
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION CONSTANTS
+# =============================================================================
+
+# Max seconds to wait for the local listener (override: PORT_FORWARD_READY_TIMEOUT)
+PORT_FORWARD_READY_TIMEOUT = float(os.environ.get("PORT_FORWARD_READY_TIMEOUT", "15"))
+PORT_FORWARD_PROBE_INTERVAL = 0.05  # seconds between connect attempts
+
+# "kubectl" (subprocess) or "api" (in-process websocket)
+PORT_FORWARD_BACKEND = os.environ.get("PORT_FORWARD_BACKEND", "kubectl")
+PORT_FORWARD_BUFFER_SIZE = 65536  # bytes per socket read when relaying
+
+# (namespace, service, port, local_port) -> live forwarder (Popen or _ApiForwarder)
+_ACTIVE = {}
+_LOCK = threading.Lock()
+
+# (namespace, service, port, local_port) -> lock held while starting that
+# target's pooled forwarder, so _LOCK isn't held through the readiness wait
+_STARTING = {}
+
+_CORE_V1 = None
+_CORE_V1_LOCK = threading.Lock()
+
+
+def _terminate(process):
+    """Terminate a forwarder, killing it if it doesn't exit within 5s."""
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _get_core_v1():
+    """
+    CoreV1Api on a dedicated ApiClient for port-forward websockets.
+    
+    kubernetes.stream temporarily patches its ApiClient's request method,
+    so forwards use their own client rather than the session fixtures'.
+    Kubeconfig is loaded on first use, falling back to the in-cluster
+    service account when there is none.
+    """
+    global _CORE_V1
+    with _CORE_V1_LOCK:
+        if _CORE_V1 is None:
+            try:
+                config.load_kube_config()
+            except config.ConfigException:
+                config.load_incluster_config()
+            api = client.ApiClient(client.Configuration.get_default_copy())
+            _CORE_V1 = client.CoreV1Api(api)
+        return _CORE_V1
+
+
+def _resolve_service_target(core_v1, namespace, service, port):
+    """
+    Resolve a service port to a ready backing pod and container port.
+    
+    Args:
+        core_v1: Kubernetes CoreV1Api client
+        namespace: Namespace of the service
+        service: Service name
+        port: Service port
+    
+    Returns:
+        tuple: (pod_name, pod_port)
+    
+    Raises:
+        RuntimeError: If the service has no selector or no ready pods
+    """
+    svc = core_v1.read_namespaced_service(service, namespace)
+    selector = svc.spec.selector or {}
+    if not selector:
+        raise RuntimeError(f"Service {namespace}/{service} has no selector to resolve pods from")
+    
+    target_port = port
+    for svc_port in svc.spec.ports or []:
+        if svc_port.port == port:
+            target_port = svc_port.target_port if svc_port.target_port is not None else port
+            break
+    
+    label_selector = ",".join(f"{k}={v}" for k, v in selector.items())
+    pods = core_v1.list_namespaced_pod(namespace, label_selector=label_selector).items
+    
+    for pod in pods:
+        if not pod.status or pod.status.phase != "Running":
+            continue
+        conditions = pod.status.conditions or []
+        if not any(c.type == "Ready" and c.status == "True" for c in conditions):
+            continue
+        
+        # Named targetPort: look it up in the pod's container ports
+        if isinstance(target_port, str) and not target_port.isdigit():
+            for container in pod.spec.containers:
+                for container_port in container.ports or []:
+                    if container_port.name == target_port:
+                        return pod.metadata.name, container_port.container_port
+            continue
+        
+        return pod.metadata.name, int(target_port)
+    
+    raise RuntimeError(f"No ready pod backs service {namespace}/{service}:{port}")
+
+
+class _ApiForwarder:
+    """
+    In-process equivalent of a `kubectl port-forward` process.
+    
+    Listens on 127.0.0.1:local_port and relays each accepted connection
+    over its own API server portforward websocket. The backing pod is
+    resolved per connection, so a forward pooled for the whole session
+    follows pod restarts like a Service would. Exposes the
+    poll/terminate/wait/kill subset of Popen used by PortForward so pooled
+    forwarders of either backend are handled alike.
+    """
+    
+    def __init__(self, core_v1, namespace, service, port, local_port):
+        self.core_v1 = core_v1
+        self.namespace = namespace
+        self.service = service
+        self.port = port
+        self.returncode = None
+        self._server = socket.create_server(("127.0.0.1", local_port))
+        threading.Thread(
+            target=self._accept_loop,
+            name=f"port-forward {namespace}/{service}:{port}",
+            daemon=True
+        ).start()
+    
+    def _connect(self):
+        """
+        Open a portforward websocket to a ready pod behind the service.
+        
+        Returns:
+            tuple: (PortForward stream, socket to the pod port)
+        """
+        pod_name, pod_port = _resolve_service_target(self.core_v1, self.namespace, self.service, self.port)
+        pf = portforward(
+            self.core_v1.connect_get_namespaced_pod_portforward,
+            pod_name, self.namespace, ports=str(pod_port)
+        )
+        return pf, pf.socket(pod_port)
+    
+    def probe(self):
+        """
+        Check that a portforward websocket to the service can be opened.
+        
+        Raises:
+            Exception: If no pod is ready or the API server refuses the forward
+        """
+        pf, _ = self._connect()
+        pf.close()
+    
+    def _accept_loop(self):
+        """Accept local connections until the listener is closed."""
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._relay, args=(conn,), daemon=True).start()
+        
+        if self.returncode is None:
+            self.returncode = 1
+    
+    def _relay(self, conn):
+        """Relay bytes between a local connection and the pod port."""
+        try:
+            pf, remote = self._connect()
+        except Exception as e:
+            logger.warning(f"Port-forward to svc/{self.service} in {self.namespace} failed: {e}")
+            conn.close()
+            return
+        
+        try:
+            peers = {conn: remote, remote: conn}
+            while True:
+                readable, _, _ = select.select(list(peers), [], [])
+                for sock in readable:
+                    data = sock.recv(PORT_FORWARD_BUFFER_SIZE)
+                    if not data:
+                        return
+                    peers[sock].sendall(data)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+            pf.close()
+    
+    def poll(self):
+        """Return None while listening, else the exit status."""
+        return self.returncode
+    
+    def terminate(self):
+        """Stop accepting connections."""
+        if self.returncode is None:
+            self.returncode = 0
+        self._server.close()
+    
+    def wait(self, timeout=None):
+        """Return the exit status (the listener closes synchronously)."""
+        return self.returncode
+    
+    kill = terminate
+
 
 class PortForward:
-    """Context manager for kubectl port-forward to any service."""
+    """Context manager for port-forwarding to any service."""
     
-    def __init__(self, namespace, service, port, local_port=None):
+    def __init__(self, namespace, service, port, local_port=None, reuse=False):
         """
         Initialize port-forward configuration.
         
@@ -20,15 +246,60 @@ class PortForward:
             service: Service name to port-forward to
             port: Remote port on the service
             local_port: Local port to bind to (defaults to same as remote port)
+            reuse: Share a pooled forwarder with other PortForwards to
+                the same target and keep it alive on exit (default: False)
         """
         self.namespace = namespace
         self.service = service
         self.port = port
         self.local_port = local_port or port
+        self.reuse = reuse
         self.process = None
     
+    @property
+    def key(self):
+        """Registry key identifying this forward's target."""
+        return (self.namespace, self.service, self.port, self.local_port)
+    
     def __enter__(self):
-        """Start port-forward."""
+        """Start port-forward, or attach to a live pooled one."""
+        if not self.reuse:
+            self._start()
+            return self
+        
+        with _LOCK:
+            starting = _STARTING.setdefault(self.key, threading.Lock())
+        
+        with starting:
+            with _LOCK:
+                process = _ACTIVE.get(self.key)
+            if process is not None and process.poll() is None:
+                self.process = process
+                return self
+            
+            self._start()
+            with _LOCK:
+                _ACTIVE[self.key] = self.process
+        
+        return self
+    
+    def _start(self):
+        """Start the forwarder for the configured backend and wait until ready."""
+        if PORT_FORWARD_BACKEND == "kubectl":
+            self._start_kubectl()
+        else:
+            self.process = _ApiForwarder(_get_core_v1(), self.namespace, self.service, self.port, self.local_port)
+        
+        # Wait for port-forward to be ready
+        try:
+            self._wait_until_ready()
+        except Exception:
+            _terminate(self.process)
+            self.process = None
+            raise
+    
+    def _start_kubectl(self):
+        """Spawn kubectl port-forward."""
         cmd = [
             "kubectl", "port-forward",
             f"svc/{self.service}",
@@ -41,17 +312,61 @@ class PortForward:
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
+    
+    def _wait_until_ready(self):
+        """
+        Block until the forward is usable.
         
-        # Wait for port-forward to be ready
-        time.sleep(10)
+        kubectl forwards are ready once the local port accepts connections.
+        The in-process listener is bound up front, so its readiness is
+        checked by opening a portforward websocket to the service instead.
         
-        return self
+        Raises:
+            RuntimeError: If the forwarder exits before the port is ready
+            TimeoutError: If the port isn't ready within PORT_FORWARD_READY_TIMEOUT
+        """
+        deadline = time.monotonic() + PORT_FORWARD_READY_TIMEOUT
+        last_error = None
+        
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"Port-forward to svc/{self.service} in {self.namespace} "
+                    f"exited with code {self.process.returncode}"
+                )
+            
+            try:
+                if isinstance(self.process, _ApiForwarder):
+                    self.process.probe()
+                else:
+                    with socket.create_connection(("127.0.0.1", self.local_port), timeout=0.2):
+                        pass
+                return
+            except Exception as e:
+                last_error = e
+                time.sleep(PORT_FORWARD_PROBE_INTERVAL)
+        
+        raise TimeoutError(
+            f"Port-forward to svc/{self.service} in {self.namespace} not ready on "
+            f"localhost:{self.local_port} after {PORT_FORWARD_READY_TIMEOUT}s: {last_error}"
+        )
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Stop port-forward."""
-        if self.process:
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+        """Stop port-forward (pooled forwards stay up until close_all())."""
+        if self.process and not self.reuse:
+            _terminate(self.process)
+        self.process = None
+    
+    @staticmethod
+    def close_all():
+        """Terminate every pooled port-forward."""
+        with _LOCK:
+            processes = list(_ACTIVE.values())
+            _ACTIVE.clear()
+        
+        for process in processes:
+            if process.poll() is None:
+                _terminate(process)
+
+
+atexit.register(PortForward.close_all)
@@ -6,30 +6,42 @@ section headers, and formatted output that can be used across test suites.
 """
 import time
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Progress bar: 20 segments of 5% each, sliced per tick rather than rebuilt
+_BAR_WIDTH = 20
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+
+# Section header rule
+_RULE = "=" * 70
+
 
 def display_progress_bar(wait_time, interval=15, description="Waiting"):
     """
     Display a progress bar with time tracking.
     
+    Ticks are scheduled against a monotonic start time, so time spent
+    logging doesn't accumulate as drift and the wait ends at wait_time.
+    
     Args:
         wait_time: Total time to wait in seconds
         interval: Update interval in seconds (default: 15)
         description: Description of what we're waiting for (default: "Waiting")
     
     Returns:
-        float: Actual elapsed time in seconds
+        float: Time actually waited in seconds
     """
-    logger.info(f"\n⏳ {description}...")
-    logger.info(f"\n   Progress:")
+    logger.info("\n⏳ %s...", description)
+    logger.info("\n   Progress:")
     
-    start_time = time.time()
+    start = time.monotonic()
+    end = start + wait_time
+    elapsed = 0
     
-    for remaining in range(wait_time, 0, -interval):
-        elapsed = wait_time - remaining
+    while elapsed < wait_time:
+        remaining = wait_time - elapsed
         elapsed_min = elapsed // 60
         elapsed_sec = elapsed % 60
         remaining_min = remaining // 60
@@ -38,19 +50,20 @@ def display_progress_bar(wait_time, interval=15, description="Waiting"):
         # Progress bar (20 segments for 100%)
         progress_pct = (elapsed / wait_time) * 100
         filled = int(progress_pct / 5)
-        bar = "█" * filled + "░" * (20 - filled)
+        bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
         
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        logger.info(f"   [{timestamp}] {bar} {progress_pct:5.1f}% | "
-              f"Elapsed: {elapsed_min:02d}:{elapsed_sec:02d} | "
-              f"Remaining: {remaining_min:02d}:{remaining_sec:02d}")
+        logger.info("   [%s] %s %5.1f%% | Elapsed: %02d:%02d | Remaining: %02d:%02d",
+                    time.strftime('%H:%M:%S'), bar, progress_pct,
+                    elapsed_min, elapsed_sec, remaining_min, remaining_sec)
         
-        time.sleep(interval)
+        next_tick = min(start + elapsed + interval, end)
+        time.sleep(max(0, next_tick - time.monotonic()))
+        elapsed += interval
     
-    actual_elapsed = time.time() - start_time
-    logger.info(f"\n✓ Wait complete! Total time: {int(actual_elapsed)}s")
+    waited = time.monotonic() - start
+    logger.info("\n✓ Wait complete! Total time: %ss", int(waited))
     
-    return actual_elapsed
+    return waited
 
 
 def print_section_header(title):
@@ -60,9 +73,9 @@ def print_section_header(title):
     Args:
         title: Section title
     """
-    logger.info("\n" + "="*70)
+    logger.info("\n%s", _RULE)
     logger.info(title)
-    logger.info("="*70)
+    logger.info(_RULE)
 
 
 def print_summary_list(items, title="Items"):
@@ -73,14 +86,17 @@ def print_summary_list(items, title="Items"):
         items: List of items to print
         title: Title for the list (default: "Items")
     """
-    logger.info(f"\n{title}:")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    logger.info("\n%s:", title)
     for idx, item in enumerate(items, 1):
         if isinstance(item, dict):
             # Format dict nicely
             name = item.get('name', 'Unknown')
             extra = {k: v for k, v in item.items() if k != 'name'}
-            logger.info(f"  [{idx}] {name}")
+            logger.info("  [%s] %s", idx, name)
             for key, value in extra.items():
-                logger.info(f"       {key}: {value}")
+                logger.info("       %s: %s", key, value)
         else:
-            logger.info(f"  [{idx}] {item}")
+            logger.info("  [%s] %s", idx, item)
@@ -4,27 +4,206 @@ Vault helper functions for secret management.
 This module provides utilities for interacting with HashiCorp Vault
 during test automation, including secret creation, reading, and cleanup.
 """
+import os
 import json
+import time
+import atexit
 import random
 import logging
+import itertools
+import threading
 from pathlib import Path
+from functools import lru_cache, wraps
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tests.helpers.port_forward import PortForward
+
 if TYPE_CHECKING:
     import hvac
-    import urllib3
 else:
-    try:
-        import hvac
-        import urllib3
-    except ImportError:
-        hvac = None  # type: ignore
-        urllib3 = None  # type: ignore
+    hvac = None  # imported on first use by _load_hvac()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
-from tests.helpers.port_forward import PortForward
+
+def _load_hvac():
+    """
+    Import hvac on first use.
+    
+    Importing tests.helpers.vault (e.g., during collection) then doesn't
+    pay hvac's import cost unless a test actually talks to Vault.
+    
+    Returns:
+        module | None: The hvac module, or None if not installed
+    """
+    global hvac
+    if hvac is None:
+        try:
+            import hvac as hvac_module
+        except ImportError:
+            return None
+        hvac = hvac_module
+    return hvac
+
+
+# Parse terraform state JSON with orjson when installed (accepts bytes or str)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Concurrent Vault calls in the *_multiple_vault_secrets / verify helpers
+VAULT_MAX_WORKERS = 16
+
+# Concurrent list calls per directory level in list_vault_secrets
+VAULT_LIST_WORKERS = 8
+
+# Keep-alive connections per Vault client; at least VAULT_MAX_WORKERS
+VAULT_POOL_SIZE = 32
+
+# Attempts per Vault call when rate limited (HTTP 429)
+VAULT_RATE_LIMIT_ATTEMPTS = 5
+VAULT_RATE_LIMIT_BACKOFF = 0.2  # seconds before the first retry, doubling after
+VAULT_RATE_LIMIT_MAX_WAIT = 30.0  # cap on a single wait
+
+# Progress lines per bulk operation (one every 100/N percent)
+VAULT_PROGRESS_UPDATES = 20
+
+
+def _mount_connection_pool(client, pool_size):
+    """
+    Size the hvac client's keep-alive pool for concurrent callers.
+    
+    requests' default pool keeps 10 connections per host, so more workers
+    than that would open (and TLS-handshake) throwaway connections.
+    Transient 502/503/504s from the port-forward are retried with a short
+    backoff.
+    
+    Args:
+        client: hvac.Client
+        pool_size: Connections to keep per host
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    client.session.mount('https://', adapter)
+    client.session.mount('http://', adapter)
+    client.session.headers['Connection'] = 'keep-alive'
+
+
+def _is_rate_limited(error):
+    """
+    Whether a Vault call failed with 429 Too Many Requests.
+    
+    Args:
+        error: Exception raised by the call
+    
+    Returns:
+        bool: True for hvac's RateLimitExceeded or a 429 response
+    """
+    if hvac is not None and isinstance(error, hvac.exceptions.RateLimitExceeded):
+        return True
+    return getattr(getattr(error, 'response', None), 'status_code', None) == 429
+
+
+def _vault_call_with_retry(func, *args, max_attempts=VAULT_RATE_LIMIT_ATTEMPTS, base=VAULT_RATE_LIMIT_BACKOFF, **kwargs):
+    """
+    Call func, retrying while Vault answers 429 Too Many Requests.
+    
+    Waits an exponential backoff with jitter between attempts. Other
+    errors propagate immediately.
+    
+    Args:
+        func: Callable making one Vault request
+        *args: Positional arguments for func
+        max_attempts: Total attempts before re-raising (default: VAULT_RATE_LIMIT_ATTEMPTS)
+        base: Delay after the first rate limit in seconds (default: VAULT_RATE_LIMIT_BACKOFF)
+        **kwargs: Keyword arguments for func
+    
+    Returns:
+        Whatever func returns
+    """
+    for attempt in range(max_attempts):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if not _is_rate_limited(e) or attempt == max_attempts - 1:
+                raise
+            delay = min(base * (2 ** attempt) + random.uniform(0, 0.1), VAULT_RATE_LIMIT_MAX_WAIT)
+            logger.debug("  Vault rate limited, retrying in %.2fs (attempt %s/%s)", delay, attempt + 1, max_attempts)
+            time.sleep(delay)
+
+
+def _retry_rate_limited(func):
+    """Decorate a Vault helper so rate-limited calls are retried."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return _vault_call_with_retry(func, *args, **kwargs)
+    return wrapper
+
+
+def _progress_step(total):
+    """Completions between progress lines so a run logs ~VAULT_PROGRESS_UPDATES of them."""
+    return max(1, total // VAULT_PROGRESS_UPDATES)
+
+
+def _run_concurrently(func, items, max_workers, progress_label):
+    """
+    Call func(item) for every item on a thread pool.
+    
+    Vault calls are network-bound over the port-forward, so W workers cut
+    wall time to roughly N/W round-trips. Completions are counted with a
+    shared itertools.count, and not at all when INFO logging is off.
+    
+    Args:
+        func: Callable taking one item; raising marks the item as failed
+        items: Items to process
+        max_workers: Maximum concurrent calls
+        progress_label: Progress suffix (e.g., "complete", "verified")
+    
+    Returns:
+        list: (item, error) tuples in item order; error is None on success
+    """
+    total = len(items)
+    if not total:
+        return []
+    
+    step = _progress_step(total)
+    completions = itertools.count(1) if logger.isEnabledFor(logging.INFO) else None
+    
+    def run(item):
+        try:
+            func(item)
+            error = None
+        except Exception as e:
+            error = e
+        
+        if completions is not None:
+            completed = next(completions)  # atomic under the GIL
+            if completed % step == 0 or completed == total:
+                percentage = (completed / total) * 100
+                logger.info("     [%s/%s] %.0f%% %s...", completed, total, percentage, progress_label)
+        
+        return item, error
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        return list(executor.map(run, items))
 
 
 def get_vault_root_token(captain_domain):
@@ -46,42 +225,98 @@ def get_vault_root_token(captain_domain):
     """
     tfstate_path = Path(f"/workspaces/glueops/{captain_domain}/terraform/vault/configuration/terraform.tfstate")
     
-    logger.info(f"  📂 Looking for terraform state: {tfstate_path}")
+    logger.info("  📂 Looking for terraform state: %s", tfstate_path)
+    
+    # One stat both checks existence and keys the token cache
+    try:
+        mtime_ns = os.stat(tfstate_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Terraform state not found: {tfstate_path}") from None
+    
+    logger.info("  ✓ Found terraform state file")
     
-    if not tfstate_path.exists():
-        raise FileNotFoundError(f"Terraform state not found: {tfstate_path}")
+    try:
+        return _read_root_token(str(tfstate_path), mtime_ns)
+    except FileNotFoundError:
+        # Removed between the stat and the open
+        raise FileNotFoundError(f"Terraform state not found: {tfstate_path}") from None
+
+
+# (type, name, mode) of the terraform data source holding Vault's access JSON
+_VAULT_ACCESS_RESOURCE = ('aws_s3_object', 'vault_access', 'data')
+
+
+@lru_cache(maxsize=8)
+def _read_root_token(tfstate_path, mtime_ns):
+    """
+    Parse a terraform state file and extract the Vault root token.
     
-    logger.info(f"  ✓ Found terraform state file")
+    Cached on (path, mtime_ns), so repeat get_vault_root_token calls skip
+    re-reading the state, and a terraform re-apply invalidates the entry.
     
-    with open(tfstate_path, 'r') as f:
-        tfstate = json.load(f)
+    Args:
+        tfstate_path: Path to terraform.tfstate
+        mtime_ns: File modification time (cache key only)
     
-    logger.info(f"  🔍 Searching for vault_access in terraform state...")
-    for resource in tfstate.get('resources', []):
-        if (resource.get('type') == 'aws_s3_object' and 
-            resource.get('name') == 'vault_access' and
-            resource.get('mode') == 'data'):
+    Returns:
+        str: Vault root token
+    
+    Raises:
+        ValueError: If root_token not found in state file
+    """
+    logger.info("  🔍 Searching for vault_access in terraform state...")
+    with open(tfstate_path, 'rb') as f:
+        for resource in _iter_tfstate_resources(f):
+            if (resource.get('type'), resource.get('name'), resource.get('mode')) != _VAULT_ACCESS_RESOURCE:
+                continue
             
             for instance in resource.get('instances', []):
                 body = instance.get('attributes', {}).get('body')
                 if body:
-                    vault_data = json.loads(body)
+                    vault_data = _json_loads(body)
                     token = vault_data.get('root_token')
                     if token:
-                        logger.info(f"  ✓ Extracted Vault root token (length: {len(token)})")
+                        logger.info("  ✓ Extracted Vault root token (length: %s)", len(token))
                         return token
+            
+            # (type, name, mode) is unique within a state; nothing further can match
+            break
     
     raise ValueError("Root token not found in terraform state")
 
 
-def get_vault_client(captain_domain, vault_namespace="glueops-core-vault", vault_service="vault"):
+def _iter_tfstate_resources(f):
     """
-    Create authenticated Vault client with kubectl port-forward.
+    Yield the resources of a terraform state file one at a time.
+    
+    With ijson installed the file is stream-parsed, so only the current
+    resource is held in memory and callers that stop early skip the rest
+    of the file. Otherwise the whole state is parsed at once with
+    _json_loads (orjson when available).
+    
+    Args:
+        f: terraform.tfstate opened in binary mode
+    
+    Yields:
+        dict: One entry of the state's 'resources' list
+    """
+    if ijson is not None:
+        yield from ijson.items(f, 'resources.item')
+    else:
+        yield from _json_loads(f.read()).get('resources', [])
+
+
+def get_vault_client(captain_domain, vault_namespace="glueops-core-vault", vault_service="vault", pool_size=VAULT_POOL_SIZE, reuse=False):
+    """
+    Create authenticated Vault client over a port-forward.
     
     Args:
         captain_domain: Domain for locating terraform state
         vault_namespace: Kubernetes namespace (default: glueops-core-vault)
         vault_service: Kubernetes service name (default: vault)
+        pool_size: Keep-alive connections to reuse across calls (default: VAULT_POOL_SIZE)
+        reuse: Use the pooled port-forward, kept up until
+            PortForward.close_all() (default: False)
     
     Returns:
         hvac.Client: Authenticated client with _port_forward attached
@@ -90,35 +325,37 @@ def get_vault_client(captain_domain, vault_namespace="glueops-core-vault", vault
         ImportError: If hvac library not installed
         Exception: If authentication fails
     """
-    if hvac is None:
+    if _load_hvac() is None:
         raise ImportError("hvac library not installed. Run: pip install hvac")
     
-    logger.info(f"\n🔐 Connecting to Vault...")
-    logger.info(f"  Namespace: {vault_namespace}")
-    logger.info(f"  Service: {vault_service}")
+    logger.info("\n🔐 Connecting to Vault...")
+    logger.info("  Namespace: %s", vault_namespace)
+    logger.info("  Service: %s", vault_service)
     
     token = get_vault_root_token(captain_domain)
     
-    logger.info(f"  🔌 Establishing port-forward to {vault_namespace}/{vault_service}:8200...")
+    logger.info("  🔌 Establishing port-forward to %s/%s:8200...", vault_namespace, vault_service)
     
-    port_forward = PortForward(namespace=vault_namespace, service=vault_service, port=8200)
+    port_forward = PortForward(namespace=vault_namespace, service=vault_service, port=8200, reuse=reuse)
     port_forward.__enter__()
     vault_addr = f"https://127.0.0.1:{port_forward.local_port}"
     
-    logger.info(f"  ✓ Port-forward established on localhost:{port_forward.local_port}")
+    logger.info("  ✓ Port-forward established on localhost:%s", port_forward.local_port)
     
-    if urllib3:
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    # Vault is reached over the port-forward with a self-signed certificate
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
-    logger.info(f"  🔑 Authenticating with Vault...")
+    logger.info("  🔑 Authenticating with Vault...")
     
     client = hvac.Client(url=vault_addr, token=token, verify=False)
+    client.session.verify = False  # session default too, for calls made on client.session directly
+    _mount_connection_pool(client, pool_size)
     
     if not client.is_authenticated():
         port_forward.__exit__(None, None, None)
         raise Exception("Failed to authenticate with Vault")
     
-    logger.info(f"  ✓ Successfully authenticated with Vault\n")
+    logger.info("  ✓ Successfully authenticated with Vault\n")
     
     client._port_forward = port_forward
     
@@ -127,21 +364,94 @@ def get_vault_client(captain_domain, vault_namespace="glueops-core-vault", vault
 
 def cleanup_vault_client(client):
     """
-    Cleanup Vault client and terminate port-forward.
+    Cleanup Vault client and release its port-forward.
+    
+    A pooled forward (reuse=True) stays up until PortForward.close_all()
+    runs at session end; otherwise it is stopped here.
     
     Args:
         client: hvac.Client returned from get_vault_client()
     """
     if hasattr(client, '_port_forward'):
-        logger.info(f"  🔌 Closing port-forward...")
+        logger.info("  🔌 Releasing port-forward...")
         client._port_forward.__exit__(None, None, None)
-        logger.info(f"  ✓ Port-forward closed\n")
+        logger.info("  ✓ Port-forward released\n")
+
+
+# (captain_domain, vault_namespace, vault_service) -> authenticated client
+# shared for the whole session
+_SHARED_CLIENTS = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_vault_client(captain_domain, vault_namespace="glueops-core-vault", vault_service="vault", pool_size=VAULT_POOL_SIZE):
+    """
+    Return the session's authenticated Vault client, connecting on first use.
+    
+    Repeat calls reuse one client, port-forward and connection pool instead
+    of re-reading the root token and re-authenticating each time. A cached
+    client whose port-forward has exited or whose token no longer
+    authenticates is released and replaced. Clients are released by
+    close_shared_vault_clients() at session end.
+    
+    Args:
+        captain_domain: Domain for locating terraform state
+        vault_namespace: Kubernetes namespace (default: glueops-core-vault)
+        vault_service: Kubernetes service name (default: vault)
+        pool_size: Keep-alive connections when first connecting (default: VAULT_POOL_SIZE)
+    
+    Returns:
+        hvac.Client: Authenticated client (do not pass to cleanup_vault_client)
+    """
+    key = (captain_domain, vault_namespace, vault_service)
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is not None and not _is_client_alive(client):
+            logger.info("  ⚠ Shared Vault client lost its connection, reconnecting...")
+            cleanup_vault_client(client)
+            client = None
+        if client is None:
+            client = get_vault_client(captain_domain, vault_namespace, vault_service, pool_size=pool_size, reuse=True)
+            _SHARED_CLIENTS[key] = client
+    return client
+
+
+def _is_client_alive(client):
+    """Whether a client's port-forward is running and its token still authenticates."""
+    process = client._port_forward.process
+    if process is None or process.poll() is not None:
+        return False
+    try:
+        return client.is_authenticated()
+    except Exception:
+        return False
+
+
+def close_shared_vault_clients():
+    """
+    Release every client handed out by get_shared_vault_client().
+    
+    Safe to call more than once; the next get_shared_vault_client()
+    reconnects.
+    """
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    
+    for client in clients:
+        cleanup_vault_client(client)
+
+
+atexit.register(close_shared_vault_clients)
 
 
 @contextmanager
-def vault_client_context(captain_domain, vault_namespace="glueops-core-vault"):
+def vault_client_context(captain_domain, vault_namespace="glueops-core-vault", pool_size=VAULT_POOL_SIZE):
     """
-    Context manager for Vault client with automatic cleanup.
+    Context manager yielding the session's shared Vault client.
+    
+    The client stays connected on exit; close_shared_vault_clients()
+    releases it at session end.
     
     Usage:
         with vault_client_context(captain_domain) as client:
@@ -150,19 +460,15 @@ def vault_client_context(captain_domain, vault_namespace="glueops-core-vault"):
     Args:
         captain_domain: Domain name
         vault_namespace: Vault namespace (default: "glueops-core-vault")
+        pool_size: Keep-alive connections when first connecting (default: VAULT_POOL_SIZE)
     
     Yields:
         hvac.Client: Authenticated Vault client
     """
-    client = None
-    try:
-        client = get_vault_client(captain_domain, vault_namespace)
-        yield client
-    finally:
-        if client:
-            cleanup_vault_client(client)
+    yield get_shared_vault_client(captain_domain, vault_namespace, pool_size=pool_size)
 
 
+@_retry_rate_limited
 def create_vault_secret(client, path, data, mount_point='secret'):
     """
     Create or update a secret in Vault KV v2.
@@ -183,6 +489,7 @@ def create_vault_secret(client, path, data, mount_point='secret'):
     )
 
 
+@_retry_rate_limited
 def read_vault_secret(client, path, mount_point='secret', raise_on_deleted_version=False):
     """
     Read a secret from Vault KV v2.
@@ -203,6 +510,7 @@ def read_vault_secret(client, path, mount_point='secret', raise_on_deleted_versi
     )
 
 
+@_retry_rate_limited
 def delete_vault_secret(client, path, mount_point='secret'):
     """
     Delete a secret and all its versions from Vault KV v2.
@@ -218,130 +526,177 @@ def delete_vault_secret(client, path, mount_point='secret'):
     )
 
 
-def create_multiple_vault_secrets(client, secret_configs, mount_point='secret'):
+def create_multiple_vault_secrets(client, secret_configs, mount_point='secret', max_workers=VAULT_MAX_WORKERS):
     """
-    Create multiple secrets in Vault with error tracking.
+    Create multiple secrets in Vault concurrently with error tracking.
     
     Args:
         client: Authenticated hvac.Client
-        secret_configs: List of dicts with 'path' and 'data' keys
+        secret_configs: List of dicts with 'path' and 'data' keys, or (path, data) tuples
         mount_point: KV mount point (default: "secret")
+        max_workers: Maximum concurrent Vault calls (default: VAULT_MAX_WORKERS)
     
     Returns:
-        tuple: (created_paths, failures)
+        tuple: (created_paths, failures) in secret_configs order
     """
     created_paths = []
     failures = []
-    total = len(secret_configs)
+    entries = _secret_entries(secret_configs)
+    total = len(entries)
     
-    logger.info(f"  📝 Creating {total} secrets...")
+    logger.info("  📝 Creating %s secrets...", total)
     
-    for idx, config in enumerate(secret_configs, 1):
-        path = config['path']
-        data = config['data']
-        
-        try:
-            create_vault_secret(client, path, data, mount_point)
+    results = _run_concurrently(
+        lambda entry: create_vault_secret(client, entry[0], entry[1], mount_point),
+        entries, max_workers, progress_label="complete"
+    )
+    
+    for (path, _), error in results:
+        if error is None:
             created_paths.append(path)
-            
-            if idx % 10 == 0:
-                percentage = (idx / total) * 100
-                logger.info(f"     [{idx}/{total}] {percentage:.0f}% complete...")
-                
-        except Exception as e:
-            error_msg = f"{path}: {str(e)}"
+        else:
+            error_msg = f"{path}: {str(error)}"
             failures.append(error_msg)
-            logger.info(f"     ✗ Failed: {error_msg}")
+            logger.info("     ✗ Failed: %s", error_msg)
     
-    success_count = len(created_paths)
-    logger.info(f"  ✓ Created {success_count}/{total} secrets successfully")
-    if failures:
-        logger.info(f"  ✗ Failed to create {len(failures)} secrets")
+    failed_count = len(failures)
+    logger.info("  ✓ Created %s/%s secrets successfully", total - failed_count, total)
+    if failed_count:
+        logger.info("  ✗ Failed to create %s secrets", failed_count)
     
     return created_paths, failures
 
 
-def delete_multiple_vault_secrets(client, paths, mount_point='secret'):
+def _secret_entries(secret_configs):
     """
-    Delete multiple secrets from Vault with error tracking.
+    Normalize secret configs to unique (path, data) tuples once, up front.
+    
+    A path given more than once is written once with its last data
+    (last write wins, as sequential writes would leave it), saving the
+    redundant KV round trips.
+    
+    Args:
+        secret_configs: Dicts with 'path' and 'data' keys, or (path, data) tuples
+    
+    Returns:
+        list: (path, data) tuples in order of each path's first appearance
+    """
+    entries = {}
+    count = 0
+    
+    for config in secret_configs:
+        path, data = (config['path'], config['data']) if isinstance(config, dict) else config
+        entries[path] = data
+        count += 1
+    
+    if len(entries) < count:
+        logger.info("  ⚠️  %s duplicate secret path(s) collapsed (last write wins)", count - len(entries))
+    
+    return list(entries.items())
+
+
+def delete_multiple_vault_secrets(client, paths, mount_point='secret', max_workers=VAULT_MAX_WORKERS):
+    """
+    Delete multiple secrets from Vault concurrently with error tracking.
     
     Args:
         client: Authenticated hvac.Client
         paths: List of secret paths to delete
         mount_point: KV mount point (default: "secret")
+        max_workers: Maximum concurrent Vault calls (default: VAULT_MAX_WORKERS)
     
     Returns:
-        tuple: (deleted_paths, failures)
+        tuple: (deleted_paths, failures) in paths order
     """
     deleted_paths = []
     failures = []
     total = len(paths)
     
-    logger.info(f"  🧹 Deleting {total} secrets...")
+    logger.info("  🧹 Deleting %s secrets...", total)
     
-    for idx, path in enumerate(paths, 1):
-        try:
-            delete_vault_secret(client, path, mount_point)
+    results = _run_concurrently(
+        lambda path: delete_vault_secret(client, path, mount_point),
+        paths, max_workers, progress_label="complete"
+    )
+    
+    for path, error in results:
+        if error is None:
             deleted_paths.append(path)
-            
-            if idx % 10 == 0:
-                percentage = (idx / total) * 100
-                logger.info(f"     [{idx}/{total}] {percentage:.0f}% complete...")
-                
-        except Exception as e:
-            error_msg = f"{path}: {str(e)}"
+        else:
+            error_msg = f"{path}: {str(error)}"
             failures.append(error_msg)
-            logger.info(f"     ✗ Failed: {error_msg}")
+            logger.info("     ✗ Failed: %s", error_msg)
     
-    success_count = len(deleted_paths)
-    if failures:
-        logger.info(f"  ⚠️  Deleted {success_count}/{total} secrets ({len(failures)} failed)")
+    failed_count = len(failures)
+    if failed_count:
+        logger.info("  ⚠️  Deleted %s/%s secrets (%s failed)", total - failed_count, total, failed_count)
     else:
-        logger.info(f"  ✓ Successfully deleted {success_count} secrets")
+        logger.info("  ✓ Successfully deleted %s secrets", total)
     
     return deleted_paths, failures
 
 
-def verify_vault_secrets(client, paths, mount_point='secret', sample_size=None):
+def _sample_paths(paths, sample_size):
     """
-    Verify that secrets exist and are readable.
+    Pick up to sample_size paths uniformly at random.
+    
+    Sampled by index, so only the chosen paths are copied.
+    
+    Args:
+        paths: List of secret paths
+        sample_size: Number of paths to pick (None or 0 for all)
+    
+    Returns:
+        tuple: (paths_to_check, total_paths)
+    """
+    total = len(paths)
+    if not sample_size or sample_size >= total:
+        return paths, total
+    return [paths[i] for i in random.sample(range(total), sample_size)], total
+
+
+def verify_vault_secrets(client, paths, mount_point='secret', sample_size=None, max_workers=VAULT_MAX_WORKERS):
+    """
+    Verify concurrently that secrets exist and are readable.
+    
+    Duplicate paths are verified once.
     
     Args:
         client: Authenticated hvac.Client
-        paths: List of secret paths to verify
+        paths: Secret paths to verify (a sequence or any iterable)
         mount_point: KV mount point (default: "secret")
         sample_size: If provided, only verify a random sample
+        max_workers: Maximum concurrent Vault calls (default: VAULT_MAX_WORKERS)
     
     Returns:
         list: List of error messages for failed verifications
     """
     failures = []
-    paths_to_check = paths
+    paths_to_check, total = _sample_paths(list(dict.fromkeys(paths)), sample_size)
     
-    if sample_size and sample_size < len(paths):
-        paths_to_check = random.sample(paths, sample_size)
-        logger.info(f"  🔍 Verifying random sample of {sample_size}/{len(paths)} secrets...")
+    if len(paths_to_check) < total:
+        logger.info("  🔍 Verifying random sample of %s/%s secrets...", len(paths_to_check), total)
     else:
-        logger.info(f"  🔍 Verifying {len(paths)} secrets...")
+        logger.info("  🔍 Verifying %s secrets...", total)
     
-    for idx, path in enumerate(paths_to_check, 1):
-        try:
-            secret = read_vault_secret(client, path, mount_point, raise_on_deleted_version=False)
-            if not secret.get('data', {}).get('data'):
-                error_msg = f"{path}: empty data"
-                failures.append(error_msg)
-                logger.info(f"     ✗ {error_msg}")
-            elif idx % 5 == 0:
-                logger.info(f"     [{idx}/{len(paths_to_check)}] verified...")
-        except Exception as e:
-            error_msg = f"{path}: {str(e)}"
+    def verify(path):
+        secret = read_vault_secret(client, path, mount_point, raise_on_deleted_version=False)
+        if not secret.get('data', {}).get('data'):
+            raise ValueError("empty data")
+    
+    results = _run_concurrently(verify, paths_to_check, max_workers, progress_label="verified")
+    
+    for path, error in results:
+        if error is not None:
+            error_msg = f"{path}: {str(error)}"
             failures.append(error_msg)
-            logger.info(f"     ✗ {error_msg}")
+            logger.info("     ✗ %s", error_msg)
     
-    success_count = len(paths_to_check) - len(failures)
-    logger.info(f"  ✓ Verified {success_count}/{len(paths_to_check)} secrets successfully")
-    if failures:
-        logger.info(f"  ✗ Failed to verify {len(failures)} secrets")
+    checked_count = len(paths_to_check)
+    failed_count = len(failures)
+    logger.info("  ✓ Verified %s/%s secrets successfully", checked_count - failed_count, checked_count)
+    if failed_count:
+        logger.info("  ✗ Failed to verify %s secrets", failed_count)
     
     return failures
 
@@ -354,42 +709,54 @@ def verify_vault_secrets(client, paths, mount_point='secret', sample_size=None):
 PLACEHOLDER_SECRET_PATH = "place-holder-secret-for-backups"
 
 
-def list_vault_secrets(client, path='', mount_point='secret'):
+def list_vault_secrets(client, path='', mount_point='secret', max_workers=VAULT_LIST_WORKERS, exclude=()):
     """
     Recursively list all secret paths under a given path in Vault KV v2.
     
+    Walks the tree breadth-first, listing every directory of a level
+    concurrently, so a tree costs one round-trip per level rather than
+    one per directory.
+    
     Args:
         client: Authenticated hvac.Client
         path: Starting path to list from (default: '' for root)
         mount_point: KV mount point (default: "secret")
+        max_workers: Maximum concurrent list calls (default: VAULT_LIST_WORKERS)
+        exclude: Secret paths to leave out of the result (default: none)
     
     Returns:
         list: List of all secret paths (full paths, not ending in /)
     """
-    all_paths = []
+    def list_keys(directory):
+        try:
+            response = client.secrets.kv.v2.list_secrets(
+                path=directory,
+                mount_point=mount_point
+            )
+        except Exception as e:
+            # Path may not exist or be empty, which is fine
+            if "permission denied" not in str(e).lower():
+                logger.debug("  Could not list path '%s': %s", directory, e)
+            return []
+        return response.get('data', {}).get('keys', [])
     
-    try:
-        response = client.secrets.kv.v2.list_secrets(
-            path=path,
-            mount_point=mount_point
-        )
-        keys = response.get('data', {}).get('keys', [])
-        
-        for key in keys:
-            full_path = f"{path}{key}" if path else key
-            
-            if key.endswith('/'):
-                # It's a directory, recurse
-                subpaths = list_vault_secrets(client, full_path, mount_point)
-                all_paths.extend(subpaths)
-            else:
-                # It's a secret
-                all_paths.append(full_path)
-                
-    except Exception as e:
-        # Path may not exist or be empty, which is fine
-        if "permission denied" not in str(e).lower():
-            logger.debug(f"  Could not list path '{path}': {e}")
+    all_paths = []
+    level = [path]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            next_level = []
+            for directory, keys in zip(level, executor.map(list_keys, level)):
+                for key in keys:
+                    full_path = f"{directory}{key}" if directory else key
+                    
+                    if key.endswith('/'):
+                        # It's a directory, list it with the next level
+                        next_level.append(full_path)
+                    elif full_path not in exclude:
+                        # It's a secret
+                        all_paths.append(full_path)
+            level = next_level
     
     return all_paths
 
@@ -412,7 +779,7 @@ def ensure_placeholder_secret(client, mount_point='secret'):
     
     timestamp = datetime.now(timezone.utc).isoformat()
     
-    logger.info(f"  📝 Ensuring placeholder secret exists: {PLACEHOLDER_SECRET_PATH}")
+    logger.info("  📝 Ensuring placeholder secret exists: %s", PLACEHOLDER_SECRET_PATH)
     
     response = create_vault_secret(
         client,
@@ -421,7 +788,7 @@ def ensure_placeholder_secret(client, mount_point='secret'):
         mount_point=mount_point
     )
     
-    logger.info(f"  ✓ Placeholder secret updated with timestamp: {timestamp}")
+    logger.info("  ✓ Placeholder secret updated with timestamp: %s", timestamp)
     
     return response
 
@@ -440,23 +807,18 @@ def cleanup_all_vault_secrets(client, mount_point='secret'):
     Raises:
         RuntimeError: If any secret deletion fails
     """
-    logger.info(f"\n🧹 Cleaning up all Vault secrets (mount: {mount_point})...")
-    
-    # List all secrets
-    all_paths = list_vault_secrets(client, path='', mount_point=mount_point)
+    logger.info("\n🧹 Cleaning up all Vault secrets (mount: %s)...", mount_point)
     
-    if not all_paths:
-        logger.info(f"  ✓ No secrets found to clean up")
-        return
-    
-    # Filter out the placeholder secret
-    paths_to_delete = [p for p in all_paths if p != PLACEHOLDER_SECRET_PATH]
+    # List all secrets except the placeholder
+    paths_to_delete = list_vault_secrets(
+        client, path='', mount_point=mount_point, exclude={PLACEHOLDER_SECRET_PATH}
+    )
     
     if not paths_to_delete:
-        logger.info(f"  ✓ No secrets to clean up (only placeholder exists)")
+        logger.info("  ✓ No secrets to clean up")
         return
     
-    logger.info(f"  Found {len(all_paths)} secret(s), deleting {len(paths_to_delete)} (preserving {PLACEHOLDER_SECRET_PATH})")
+    logger.info("  Deleting %s secret(s) (preserving %s)", len(paths_to_delete), PLACEHOLDER_SECRET_PATH)
     
     # Delete secrets
     deleted_paths, failures = delete_multiple_vault_secrets(client, paths_to_delete, mount_point)
@@ -466,7 +828,7 @@ def cleanup_all_vault_secrets(client, mount_point='secret'):
             f"Failed to delete {len(failures)} Vault secret(s):\n" +
             "\n".join(f"  - {f}" for f in failures)
         )
-        logger.error(f"  ✗ {error_msg}")
+        logger.error("  ✗ %s", error_msg)
         raise RuntimeError(error_msg)
     
-    logger.info(f"  ✓ Successfully deleted {len(deleted_paths)} secret(s)\n")
+    logger.info("  ✓ Successfully deleted %s secret(s)\n", len(deleted_paths))
@@ -1,11 +1,11 @@
 """Backup CronJob tests"""
 import pytest
-import subprocess
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from kubernetes.client.rest import ApiException
-from tests.helpers.k8s import wait_for_job_completion, validate_pod_execution
+from tests.helpers.k8s import create_job_from_cronjob, wait_for_jobs_completion, validate_pod_execution
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,7 @@ def create_vault_backup_test_secret(vault_test_secrets):
 @pytest.mark.important
 @pytest.mark.readonly
 @pytest.mark.backup
-def test_backup_cronjobs_status(core_v1, batch_v1):
+def test_backup_cronjobs_status(core_v1, backup_cronjobs, backup_jobs_by_cronjob):
     """Check backup CronJobs have successful recent executions (read-only).
     
     Validates:
@@ -59,19 +59,11 @@ def test_backup_cronjobs_status(core_v1, batch_v1):
     """
     backup_namespace = "glueops-core-backup"
     
-    try:
-        cronjobs = batch_v1.list_namespaced_cron_job(namespace=backup_namespace)
-    except ApiException as e:
-        if e.status == 404:
-            pytest.fail(f"Namespace {backup_namespace} not found")
-        else:
-            pytest.fail(f"API error: {e.reason}")
-    
-    assert cronjobs.items, f"No CronJobs found in {backup_namespace}"
+    assert backup_cronjobs, f"No CronJobs found in {backup_namespace}"
     
     problems = []
     
-    for cronjob in cronjobs.items:
+    for cronjob in backup_cronjobs:
         cj_name = cronjob.metadata.name
         
         if cronjob.spec.suspend:
@@ -79,19 +71,14 @@ def test_backup_cronjobs_status(core_v1, batch_v1):
             continue
         
         # Find recent jobs
-        jobs = batch_v1.list_namespaced_job(
-            namespace=backup_namespace,
-            label_selector=f"cronjob={cj_name}"
-        )
+        jobs = backup_jobs_by_cronjob.get(cj_name)
         
-        if not jobs.items:
+        if not jobs:
             problems.append(f"{cj_name}: no recent execution")
             continue
         
         # Check most recent job
-        recent_job = sorted(jobs.items, 
-                          key=lambda j: j.metadata.creation_timestamp, 
-                          reverse=True)[0]
+        recent_job = max(jobs, key=lambda j: j.metadata.creation_timestamp)
         
         if recent_job.status.failed:
             problems.append(f"{cj_name}: job failed")
@@ -102,7 +89,7 @@ def test_backup_cronjobs_status(core_v1, batch_v1):
                 problems.append(f"{cj_name}: {message}")
     
     assert not problems, (
-        f"{len(problems)} backup CronJob issue(s) (total: {len(cronjobs.items)} jobs):\n" +
+        f"{len(problems)} backup CronJob issue(s) (total: {len(backup_cronjobs)} jobs):\n" +
         "\n".join(f"  - {p}" for p in problems)
     )
 
@@ -111,13 +98,13 @@ def test_backup_cronjobs_status(core_v1, batch_v1):
 @pytest.mark.write
 @pytest.mark.backup
 @pytest.mark.vault
-def test_backup_cronjobs_trigger(core_v1, batch_v1, vault_test_secrets):
+def test_backup_cronjobs_trigger(core_v1, batch_v1, backup_cronjobs, vault_test_secrets):
     """Manually trigger backup CronJobs and validate execution (WRITE operation).
     
     Trigger mode:
     - Creates Vault test secret with timestamp (using vault_test_secrets fixture)
-    - Manually creates Job from each CronJob using kubectl
-    - Waits up to 300 seconds for all jobs to complete
+    - Manually creates Job from each CronJob via the Kubernetes API
+    - Waits for all jobs to complete concurrently
     - Validates execution: checks pod phase, exit codes, restart counts
     - Reports failures if jobs timeout, fail, or have execution issues
     
@@ -127,15 +114,7 @@ def test_backup_cronjobs_trigger(core_v1, batch_v1, vault_test_secrets):
     """
     backup_namespace = "glueops-core-backup"
     
-    try:
-        cronjobs = batch_v1.list_namespaced_cron_job(namespace=backup_namespace)
-    except ApiException as e:
-        if e.status == 404:
-            pytest.fail(f"Namespace {backup_namespace} not found")
-        else:
-            pytest.fail(f"API error: {e.reason}")
-    
-    assert cronjobs.items, f"No CronJobs found in {backup_namespace}"
+    assert backup_cronjobs, f"No CronJobs found in {backup_namespace}"
     
     problems = []
     triggered_jobs = []
@@ -143,33 +122,44 @@ def test_backup_cronjobs_trigger(core_v1, batch_v1, vault_test_secrets):
     # Create test secret in Vault before triggering backups
     create_vault_backup_test_secret(vault_test_secrets)
     
-    for cronjob in cronjobs.items:
+    def trigger(cronjob):
         cj_name = cronjob.metadata.name
         job_name = f"{cj_name}-{int(time.time())}"
         
-        result = subprocess.run(
-            ["kubectl", "create", "job", job_name, 
-             "--from", f"cronjob/{cj_name}", "-n", backup_namespace],
-            capture_output=True, text=True, timeout=30
-        )
-        
-        if result.returncode == 0:
-            triggered_jobs.append({"name": job_name, "cronjob": cj_name})
-        else:
-            problems.append(f"{cj_name}: {result.stderr.strip()}")
-    
-    # Wait for triggered jobs
-    for job_info in triggered_jobs:
-        status = wait_for_job_completion(batch_v1, job_info["name"], backup_namespace)
-        
+        try:
+            create_job_from_cronjob(batch_v1, cronjob, job_name, backup_namespace)
+            return {"name": job_name, "cronjob": cj_name}, None
+        except ApiException as e:
+            return None, f"{cj_name}: {e.reason}"
+    
+    # Trigger all CronJobs at once
+    with ThreadPoolExecutor(max_workers=len(backup_cronjobs)) as executor:
+        for job_info, problem in executor.map(trigger, backup_cronjobs):
+            if problem:
+                problems.append(problem)
+            else:
+                triggered_jobs.append(job_info)
+    
+    # Wait for triggered jobs concurrently
+    statuses = wait_for_jobs_completion(
+        batch_v1, [job_info["name"] for job_info in triggered_jobs], backup_namespace
+    )
+    
+    def check(job_info, status):
         if status == "timeout":
-            problems.append(f"{job_info['cronjob']}: timeout")
-        elif status == "failed":
-            problems.append(f"{job_info['cronjob']}: job failed")
-        else:
-            success, message = validate_pod_execution(core_v1, job_info["name"], backup_namespace)
-            if not success:
-                problems.append(f"{job_info['cronjob']}: {message}")
+            return f"{job_info['cronjob']}: timeout"
+        if status == "failed":
+            return f"{job_info['cronjob']}: job failed"
+        
+        success, message = validate_pod_execution(core_v1, job_info["name"], backup_namespace)
+        if not success:
+            return f"{job_info['cronjob']}: {message}"
+        return None
+    
+    # Validate pod execution of all finished jobs concurrently
+    if triggered_jobs:
+        with ThreadPoolExecutor(max_workers=len(triggered_jobs)) as executor:
+            problems.extend(p for p in executor.map(check, triggered_jobs, statuses) if p)
     
     assert not problems, (
         f"{len(problems)} triggered backup job issue(s) (triggered: {len(triggered_jobs)} jobs):\n" +
@@ -3,10 +3,17 @@ import pytest
 import json
 import os
 import time
+import tempfile
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 # Percentage of baseline metrics allowed to be missing before test fails.
@@ -14,6 +21,19 @@ logger = logging.getLogger(__name__)
 # they are logged as warnings instead of causing a failure.
 MISSING_METRICS_TOLERANCE_PCT = 10.0
 
+# Metric name lists are reused from an on-disk cache within the same
+# window of this many seconds (end time snapped down to a multiple)
+METRIC_CACHE_TTL = 300
+
+# One JSON file per captain domain. Not .pytest_cache: pytest.ini disables
+# the cacheprovider plugin.
+METRIC_CACHE_DIR = Path(tempfile.gettempdir()) / "glueops-prometheus-metric-names"
+
+# Keep-alive session for Prometheus queries over the port-forward
+_SESSION = requests.Session()
+_SESSION.headers["Accept-Encoding"] = "gzip"
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 # Whitelist of metrics that are expected to be missing intermittently
 IGNORABLE_MISSING_METRICS = [
     "vault_identity_entity_creation",
@@ -27,44 +47,90 @@ IGNORABLE_MISSING_METRICS = [
     "vault_storage_packer_put_item_count",
     "vault_storage_packer_put_item_sum"
 ]
+_IGNORABLE_MISSING = frozenset(IGNORABLE_MISSING_METRICS)
 
 
-def query_all_metrics(prometheus_url):
+def query_all_metrics(prometheus_url, end_time=None):
     """Query Prometheus and return set of metric names (deduplicated)
     
-    Queries last 24 hours of metrics using series endpoint to capture
-    metrics that may not be present at exact instant of query.
-    Returns deduplicated set of metric names only (ignoring labels).
+    Queries the 24 hours before end_time (default: now) using the __name__
+    label values endpoint to capture metrics that may not be present at
+    exact instant of query. Prometheus deduplicates the names server-side, so no
+    per-series labels are transferred. With ijson installed the response
+    is stream-parsed, adding names to the set as they arrive.
     """
     # Query all time series from last 24 hours (86400 seconds)
     # Longer window captures intermittent metrics (e.g., vault_expire_* only appears during lease expiration)
-    end_time = time.time()
+    if end_time is None:
+        end_time = time.time()
     start_time = end_time - (24 * 60 * 60)  # 24 hours ago
     
-    response = requests.get(
-        f"{prometheus_url}/api/v1/series",
+    response = _SESSION.get(
+        f"{prometheus_url}/api/v1/label/__name__/values",
         params={
-            "match[]": "{__name__=~\".+\"}",
             "start": start_time,
             "end": end_time
         },
-        timeout=30
+        timeout=30,
+        stream=ijson is not None
     )
     
     if response.status_code != 200:
         raise Exception(f"Prometheus API returned status {response.status_code}")
     
-    data = response.json()
+    if ijson is not None:
+        # One streaming pass collects the names and the status/error fields
+        data = {'data': set()}
+        with response:
+            response.raw.decode_content = True
+            for prefix, _, value in ijson.parse(response.raw):
+                if prefix == 'data.item':
+                    data['data'].add(value)
+                elif prefix in ('status', 'error'):
+                    data[prefix] = value
+    else:
+        data = response.json()
+    
     if data.get('status') != 'success':
         raise Exception(f"Prometheus query failed: {data.get('error', 'unknown error')}")
     
-    # Use set for automatic deduplication of metric names
-    metrics = set()
-    for series in data['data']:
-        metric_name = series.get('__name__', '')
-        if metric_name:
-            metrics.add(metric_name)
+    return set(data['data'])
+
+
+def cached_query_all_metrics(config, prometheus_url, captain_domain):
+    """Return query_all_metrics(), reusing a result from the last METRIC_CACHE_TTL seconds
+    
+    The 24h name scan ends at the current time snapped down to
+    METRIC_CACHE_TTL, and is cached in METRIC_CACHE_DIR per captain domain
+    under that same window, so every run in a window queries the same
+    range and repeated runs in a dev loop skip the Prometheus round-trip.
+    Bypassed with --no-metric-cache. An unreadable cache file counts as a
+    miss.
+    """
+    if config.getoption("--no-metric-cache"):
+        return query_all_metrics(prometheus_url)
+    
+    cache_file = METRIC_CACHE_DIR / f"{captain_domain}.json"
+    window = int(time.time() // METRIC_CACHE_TTL) * METRIC_CACHE_TTL
+    
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+    
+    if cached and cached.get("window") == window:
+        logger.info(f"Using metric names cached at {window} (pass --no-metric-cache to re-query)")
+        return set(cached["metric_names"])
+    
+    metrics = query_all_metrics(prometheus_url, end_time=window)
     
+    # Write-then-rename so concurrent xdist workers never read a partial file
+    METRIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp_file, "w") as f:
+        json.dump({"window": window, "metric_names": sorted(metrics)}, f)
+    os.replace(tmp_file, cache_file)
     return metrics
 
 
@@ -148,7 +214,10 @@ def test_prometheus_metrics_existence(core_v1, captain_domain, prometheus_url, r
     
     # Use prometheus_url fixture (port-forward already established)
     logger.info(f"Querying Prometheus at {prometheus_url} (read-only)")
-    current_metrics = query_all_metrics(prometheus_url)
+    if force_update:
+        current_metrics = query_all_metrics(prometheus_url)
+    else:
+        current_metrics = cached_query_all_metrics(request.config, prometheus_url, captain_domain)
     logger.info(f"Found {len(current_metrics)} unique metric names")
     
     # First run or force update - create/recreate baseline (writes to LOCAL filesystem only)
@@ -172,8 +241,8 @@ def test_prometheus_metrics_existence(core_v1, captain_domain, prometheus_url, r
     new = current_set - baseline_set
     
     # Separate whitelisted missing metrics from unexpected missing metrics
-    whitelisted_missing = missing & set(IGNORABLE_MISSING_METRICS)
-    unexpected_missing = missing - set(IGNORABLE_MISSING_METRICS)
+    whitelisted_missing = missing & _IGNORABLE_MISSING
+    unexpected_missing = missing - _IGNORABLE_MISSING
     
     # Report new metrics (informational)
     if new:
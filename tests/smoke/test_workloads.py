@@ -2,6 +2,8 @@
 import pytest
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from tests.helpers.constants import VALID_OAUTH2_MIDDLEWARES
 from tests.helpers.k8s import (
     validate_pod_health,
     validate_failed_jobs,
@@ -21,6 +23,72 @@ PASSABLE_ALERTS = [
 ]
 
 
+# Concurrent HTTP probes in test_ingress_oauth2_redirect
+OAUTH2_CHECK_WORKERS = 16
+
+
+def _check_oauth2_ingress(ingress):
+    """Check one ingress for OAuth2 middleware and HTTP protection.
+    
+    Runs in a worker thread, so log lines are returned rather than logged
+    to keep output ordered.
+    
+    Args:
+        ingress: V1Ingress with class 'platform-traefik'
+    
+    Returns:
+        tuple: (problems, log_messages)
+    """
+    name = f"{ingress.metadata.namespace}/{ingress.metadata.name}"
+    problems = []
+    messages = []
+    annotations = ingress.metadata.annotations or {}
+    
+    # Check for Traefik router.middlewares annotation
+    middlewares = annotations.get("traefik.ingress.kubernetes.io/router.middlewares", "")
+    
+    if not middlewares:
+        problems.append(f"{name}: missing traefik.ingress.kubernetes.io/router.middlewares annotation")
+    elif not any(mw in middlewares for mw in VALID_OAUTH2_MIDDLEWARES):
+        problems.append(
+            f"{name}: router.middlewares '{middlewares}' does not contain "
+            f"a valid oauth2-proxy middleware"
+        )
+    else:
+        messages.append(f"{name}: router.middlewares ✓ ({middlewares})")
+    
+    # Test actual HTTP protection if ingress has hosts
+    if ingress.spec and ingress.spec.rules:
+        for rule in ingress.spec.rules:
+            if not rule.host:
+                continue
+            
+            host = rule.host.strip()
+            # Try HTTP request to verify protection
+            try:
+                url = f"http://{host}"
+                response = requests.get(url, allow_redirects=False, timeout=5, verify=False)
+                
+                # Check if we get a redirect (301, 302, 307, 308) or auth challenge
+                if response.status_code in [301, 302, 307, 308]:
+                    location = response.headers.get('Location', '')
+                    messages.append(f"{name} ({host}): redirect to '{location}' ✓")
+                elif response.status_code in [401, 403]:
+                    # Auth challenge without redirect - still protected (no-redirect middleware)
+                    messages.append(f"{name} ({host}): auth challenge (status {response.status_code}) ✓")
+                else:
+                    messages.append(f"{name} ({host}): unexpected status {response.status_code}")
+            
+            except requests.exceptions.Timeout:
+                messages.append(f"{name} ({host}): HTTP request timeout (skipped)")
+            except requests.exceptions.ConnectionError:
+                messages.append(f"{name} ({host}): connection failed (skipped)")
+            except Exception as e:
+                messages.append(f"{name} ({host}): HTTP test error: {e}")
+    
+    return problems, messages
+
+
 @pytest.mark.smoke
 @pytest.mark.quick
 @pytest.mark.critical
@@ -100,7 +168,7 @@ def test_failed_jobs(batch_v1, platform_namespaces) -> None:
 @pytest.mark.critical
 @pytest.mark.readonly
 @pytest.mark.ingress
-def test_ingress_validity(networking_v1, platform_namespaces):
+def test_ingress_validity(networking_v1, platform_namespaces, platform_ingresses):
     """Check all Ingress objects are valid with proper configuration.
     
     Validates:
@@ -116,7 +184,7 @@ def test_ingress_validity(networking_v1, platform_namespaces):
     logger.info("INGRESS VALIDITY CHECK")
     logger.info("="*70)
     
-    problems, total_ingresses = validate_ingress_configuration(networking_v1, platform_namespaces)
+    problems, total_ingresses = validate_ingress_configuration(networking_v1, platform_namespaces, platform_ingresses)
     
     logger.info("\n" + "="*70)
     logger.info("SUMMARY")
@@ -136,7 +204,7 @@ def test_ingress_validity(networking_v1, platform_namespaces):
 @pytest.mark.important
 @pytest.mark.readonly
 @pytest.mark.dns
-def test_ingress_dns(networking_v1, platform_namespaces):
+def test_ingress_dns(networking_v1, platform_namespaces, platform_ingresses):
     """Verify ingress hosts resolve to correct load balancer IPs via DNS.
     
     For each ingress with a load balancer IP:
@@ -154,7 +222,9 @@ def test_ingress_dns(networking_v1, platform_namespaces):
     logger.info("INGRESS DNS CHECK")
     logger.info("="*70)
     
-    problems, checked_count = validate_ingress_dns(networking_v1, platform_namespaces, dns_server='1.1.1.1')
+    problems, checked_count = validate_ingress_dns(
+        networking_v1, platform_namespaces, dns_server='1.1.1.1', ingresses=platform_ingresses
+    )
     
     logger.info("\n" + "="*70)
     logger.info("SUMMARY")
@@ -174,7 +244,7 @@ def test_ingress_dns(networking_v1, platform_namespaces):
 @pytest.mark.important
 @pytest.mark.readonly
 @pytest.mark.oauth2
-def test_ingress_oauth2_redirect(networking_v1, platform_namespaces, captain_domain):
+def test_ingress_oauth2_redirect(networking_v1, platform_namespaces, platform_ingresses, captain_domain):
     """Verify ingresses have Traefik OAuth2 middleware annotations and are protected.
     
     Validates OAuth2 protection for ingresses with class 'platform-traefik':
@@ -191,73 +261,34 @@ def test_ingress_oauth2_redirect(networking_v1, platform_namespaces, captain_dom
     
     Cluster Impact: READ-ONLY (queries ingress resources + external HTTP requests)
     """
-    from tests.helpers.constants import VALID_OAUTH2_MIDDLEWARES
-
     ingress_classes = ["platform-traefik"]
     exceptions = ["oauth2-proxy", "glueops-dex"]
     problems = []
-    checked_count = 0
+    candidates = []
     
-    for namespace in platform_namespaces:
-        ingresses = networking_v1.list_namespaced_ingress(namespace=namespace)
+    for ingress in platform_ingresses:
+        name = f"{ingress.metadata.namespace}/{ingress.metadata.name}"
         
-        for ingress in ingresses.items:
-            name = f"{namespace}/{ingress.metadata.name}"
-            
-            # Check if ingress class matches our criteria
-            ingress_class = ingress.spec.ingress_class_name
-            if not ingress_class or ingress_class not in ingress_classes:
-                continue
-            
-            # Check if ingress is in exception list
-            if ingress.metadata.name in exceptions:
-                logger.info(f"{name}: skipped (in exception list)")
-                continue
-            
-            checked_count += 1
-            annotations = ingress.metadata.annotations or {}
-            
-            # Check for Traefik router.middlewares annotation
-            middlewares = annotations.get("traefik.ingress.kubernetes.io/router.middlewares", "")
-            
-            if not middlewares:
-                problems.append(f"{name}: missing traefik.ingress.kubernetes.io/router.middlewares annotation")
-            elif not any(mw in middlewares for mw in VALID_OAUTH2_MIDDLEWARES):
-                problems.append(
-                    f"{name}: router.middlewares '{middlewares}' does not contain "
-                    f"a valid oauth2-proxy middleware"
-                )
-            else:
-                logger.info(f"{name}: router.middlewares ✓ ({middlewares})")
-            
-            # Test actual HTTP protection if ingress has hosts
-            if ingress.spec and ingress.spec.rules:
-                for rule in ingress.spec.rules:
-                    if not rule.host:
-                        continue
-                    
-                    host = rule.host.strip()
-                    # Try HTTP request to verify protection
-                    try:
-                        url = f"http://{host}"
-                        response = requests.get(url, allow_redirects=False, timeout=5, verify=False)
-                        
-                        # Check if we get a redirect (301, 302, 307, 308) or auth challenge
-                        if response.status_code in [301, 302, 307, 308]:
-                            location = response.headers.get('Location', '')
-                            logger.info(f"{name} ({host}): redirect to '{location}' ✓")
-                        elif response.status_code in [401, 403]:
-                            # Auth challenge without redirect - still protected (no-redirect middleware)
-                            logger.info(f"{name} ({host}): auth challenge (status {response.status_code}) ✓")
-                        else:
-                            logger.info(f"{name} ({host}): unexpected status {response.status_code}")
-                    
-                    except requests.exceptions.Timeout:
-                        logger.info(f"{name} ({host}): HTTP request timeout (skipped)")
-                    except requests.exceptions.ConnectionError:
-                        logger.info(f"{name} ({host}): connection failed (skipped)")
-                    except Exception as e:
-                        logger.info(f"{name} ({host}): HTTP test error: {e}")
+        # Check if ingress class matches our criteria
+        ingress_class = ingress.spec.ingress_class_name
+        if not ingress_class or ingress_class not in ingress_classes:
+            continue
+        
+        # Check if ingress is in exception list
+        if ingress.metadata.name in exceptions:
+            logger.info(f"{name}: skipped (in exception list)")
+            continue
+        
+        candidates.append(ingress)
+    
+    checked_count = len(candidates)
+    
+    # HTTP probes are network-bound; run them concurrently and log in order
+    with ThreadPoolExecutor(max_workers=OAUTH2_CHECK_WORKERS) as executor:
+        for ingress_problems, messages in executor.map(_check_oauth2_ingress, candidates):
+            for message in messages:
+                logger.info(message)
+            problems.extend(ingress_problems)
     
     assert not problems, (
         f"{len(problems)} OAuth2 configuration issue(s) found (checked {checked_count} ingresses):\n" +